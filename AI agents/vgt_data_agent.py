@@ -6,8 +6,13 @@ Implements Chat Protocol for user interaction via ASI:One.
 
 from datetime import datetime, timezone
 from uuid import uuid4
+import asyncio
+import functools
 import json
 import os
+import re
+import time
+import aiohttp
 from dotenv import load_dotenv
 from uagents import Agent, Context, Model, Protocol
 from uagents_core.contrib.protocols.chat import (
@@ -18,9 +23,14 @@ from uagents_core.contrib.protocols.chat import (
     TextContent,
     chat_protocol_spec,
 )
-import requests
 from web3 import Web3
 
+try:
+    # orjson parses the ABI blob and Hermes payloads several times faster when available
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 load_dotenv()
 
 # Initialize agent with Mailbox for Agentverse hosting
@@ -38,6 +48,10 @@ ARBITRUM_RPC = os.getenv("ARBITRUM_RPC_URL")
 GMX_READER_ADDRESS = os.getenv("GMX_READER_ADDRESS")
 VGT_VAULT_ADDRESS = os.getenv("VGT_VAULT_ADDRESS")
 ALPHA_VANTAGE_KEY = os.getenv("ALPHA_VANTAGE_KEY")
+HTTP_CONNECT_TIMEOUT_SECONDS = 2
+HTTP_TIMEOUT_SECONDS = 5
+FETCH_TIMEOUT_SECONDS = 6  # Upper bound per source so a collection tick always completes
+CHAT_CACHE_TTL_SECONDS = 5
 
 # Pyth price feed IDs
 PRICE_FEEDS = {
@@ -57,7 +71,19 @@ class PortfolioQuery(Model):
     query_type: str  # "current_allocation", "nav", "performance"
 
 # Web3 setup
-w3 = Web3(Web3.HTTPProvider(ARBITRUM_RPC))
+w3 = Web3(Web3.HTTPProvider(ARBITRUM_RPC, request_kwargs={"timeout": HTTP_TIMEOUT_SECONDS}))
+
+# Parse the vault ABI and checksum its address once instead of on every fetch
+try:
+    vault_contract = w3.eth.contract(
+        address=Web3.to_checksum_address(VGT_VAULT_ADDRESS),
+        abi=json_loads(os.getenv("VAULT_ABI"))
+    )
+except (TypeError, ValueError):
+    vault_contract = None  # VGT_VAULT_ADDRESS / VAULT_ABI not configured
+
+# Shared HTTP session, created on startup so it binds to the agent's event loop
+http_session: aiohttp.ClientSession | None = None
 
 def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
     """Create a chat message for ASI:One interaction"""
@@ -70,46 +96,72 @@ def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
         content=content,
     )
 
+def async_ttl_cache(ttl: float):
+    """
+    Cache the latest non-empty result of an async fetcher for `ttl` seconds.
+    Concurrent callers share a single in-flight fetch; pass force_refresh=True to bypass.
+    """
+    def decorator(func):
+        lock = asyncio.Lock()
+        cached = {"value": None, "expires_at": 0.0}
+
+        @functools.wraps(func)
+        async def wrapper(ctx: Context, force_refresh: bool = False) -> dict:
+            async with lock:
+                if not force_refresh and cached["value"] and time.monotonic() < cached["expires_at"]:
+                    return cached["value"]
+                result = await func(ctx)
+                if result:
+                    cached["value"] = result
+                    cached["expires_at"] = time.monotonic() + ttl
+                return result
+        return wrapper
+    return decorator
+
+@async_ttl_cache(ttl=CHAT_CACHE_TTL_SECONDS)
 async def fetch_pyth_prices(ctx: Context) -> dict:
     """Fetch latest prices from Pyth Hermes API"""
     prices = {}
     try:
-        for asset, feed_id in PRICE_FEEDS.items():
-            response = requests.get(
-                f"{PYTH_HERMES_URL}",
-                params={"ids[]": feed_id}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("parsed"):
-                    price_data = data["parsed"][0]["price"]
-                    # Pyth prices have exponent, need to adjust
-                    price = int(price_data["price"]) * (10 ** int(price_data["expo"]))
-                    confidence = int(price_data["conf"]) * (10 ** int(price_data["expo"]))
-                    
-                    prices[asset] = {
-                        "price": price,
-                        "confidence": confidence,
-                        "timestamp": data["parsed"][0]["metadata"]["timestamp"]
-                    }
-                    ctx.logger.info(f"Fetched {asset} price: ${price:.2f}")
+        # Hermes accepts multiple ids[] params and returns the parsed feeds in request order
+        params = [("ids[]", feed_id) for feed_id in PRICE_FEEDS.values()]
+        async with http_session.get(PYTH_HERMES_URL, params=params) as response:
+            if response.status != 200:
+                ctx.logger.error(f"Pyth Hermes returned status {response.status}")
+                return {}
+            data = json_loads(await response.read())
+
+        for asset, parsed in zip(PRICE_FEEDS.keys(), data.get("parsed", [])):
+            price_data = parsed["price"]
+            # Pyth prices have exponent, need to adjust
+            scale = 10 ** int(price_data["expo"])
+            price = int(price_data["price"]) * scale
+            confidence = int(price_data["conf"]) * scale
+
+            prices[asset] = {
+                "price": price,
+                "confidence": confidence,
+                "timestamp": parsed["metadata"]["timestamp"]
+            }
+            ctx.logger.info(f"Fetched {asset} price: ${price:.2f}")
         return prices
     except Exception as e:
         ctx.logger.error(f"Error fetching Pyth prices: {e}")
         return {}
 
+@async_ttl_cache(ttl=CHAT_CACHE_TTL_SECONDS)
 async def fetch_gmx_positions(ctx: Context) -> dict:
     """Fetch current GMX position data via Web3"""
     positions = {}
     try:
-        # Read from VGT Vault contract
-        vault_contract = w3.eth.contract(
-            address=Web3.to_checksum_address(VGT_VAULT_ADDRESS),
-            abi=json.loads(os.getenv("VAULT_ABI"))
-        )
-        
+        if vault_contract is None:
+            raise RuntimeError("VGT_VAULT_ADDRESS and VAULT_ABI must be configured")
+
         # Call getPositionBreakdown view function
-        breakdown = vault_contract.functions.getPositionBreakdown().call()
+        # web3's HTTPProvider is blocking, so run the call off the event loop
+        breakdown = await asyncio.to_thread(
+            vault_contract.functions.getPositionBreakdown().call
+        )
         
         positions = {
             "gold": {
@@ -131,9 +183,11 @@ async def fetch_gmx_positions(ctx: Context) -> dict:
         }
         
         # Calculate total exposure and weights
-        total_exposure = sum(p["exposure_usd"] for k, p in positions.items() if "exposure_usd" in p)
-        for asset in ["gold", "silver", "oil"]:
-            positions[asset]["weight"] = positions[asset]["exposure_usd"] / total_exposure if total_exposure > 0 else 0
+        assets = ("gold", "silver", "oil")
+        total_exposure = sum(positions[asset]["exposure_usd"] for asset in assets)
+        inv_total = 1 / total_exposure if total_exposure > 0 else 0
+        for asset in assets:
+            positions[asset]["weight"] = positions[asset]["exposure_usd"] * inv_total
         
         ctx.logger.info(f"Fetched GMX positions: {positions}")
         return positions
@@ -164,6 +218,60 @@ async def fetch_economic_indicators(ctx: Context) -> dict:
         ctx.logger.error(f"Error fetching economic indicators: {e}")
         return {}
 
+# Chat intents, checked in priority order when a query matches several
+_INTENT_RE = re.compile(r"(?P<allocation>allocation|portfolio)|(?P<price>price|cost)|(?P<market>market|condition)")
+_INTENT_PRIORITY = ("allocation", "price", "market")
+
+def classify_intent(user_query: str) -> str | None:
+    """Map a lowercased chat query to an intent in a single regex pass"""
+    found = {m.lastgroup for m in _INTENT_RE.finditer(user_query)}
+    return next((intent for intent in _INTENT_PRIORITY if intent in found), None)
+
+async def describe_allocation(ctx: Context) -> str:
+    """Format the current portfolio allocation for chat"""
+    positions = await fetch_gmx_positions(ctx)
+    return "\n".join([
+        "**Current Portfolio Allocation:**",
+        "",
+        f"🥇 Gold: {positions['gold']['weight']*100:.1f}% (${positions['gold']['exposure_usd']:,.0f})",
+        f"🥈 Silver: {positions['silver']['weight']*100:.1f}% (${positions['silver']['exposure_usd']:,.0f})",
+        f"🛢️ Oil: {positions['oil']['weight']*100:.1f}% (${positions['oil']['exposure_usd']:,.0f})",
+        f"💵 Cash Reserve: ${positions['cash']['amount_usd']:,.0f}",
+        "",
+        f"📊 Unrealized P&L: ${positions['unrealized_pnl']:,.0f}",
+    ])
+
+async def describe_prices(ctx: Context) -> str:
+    """Format the latest asset prices for chat"""
+    prices = await fetch_pyth_prices(ctx)
+    lines = ["**Current Asset Prices:**\n\n"]
+    lines.extend(f"{asset.title()}: ${data['price']:,.2f}\n" for asset, data in prices.items())
+    return "".join(lines)
+
+async def describe_market(ctx: Context) -> str:
+    """Format the current market conditions for chat"""
+    indicators = await fetch_economic_indicators(ctx)
+    return "\n".join([
+        "**Market Conditions:**",
+        "",
+        f"CPI Inflation: {indicators['cpi_annual_rate']}%",
+        f"Interest Rate: {indicators['interest_rate']}%",
+        f"VIX Volatility: {indicators['vix_volatility']}",
+        f"Sentiment: {indicators['market_sentiment'].title()}",
+        f"Geopolitical Risk: {indicators['geopolitical_risk'].title()}",
+    ])
+
+async def describe_help(ctx: Context) -> str:
+    """Fallback reply for queries with no recognised intent"""
+    return "I can help you with portfolio allocation, current prices, or market conditions. Please ask about one of these topics."
+
+INTENT_HANDLERS = {
+    "allocation": describe_allocation,
+    "price": describe_prices,
+    "market": describe_market,
+    None: describe_help,
+}
+
 # Chat Protocol for ASI:One interaction
 chat_proto = Protocol(spec=chat_protocol_spec)
 
@@ -202,32 +310,7 @@ async def handle_chat_message(ctx: Context, sender: str, msg: ChatMessage):
             
             try:
                 # Parse user intent and fetch data
-                if "allocation" in user_query or "portfolio" in user_query:
-                    positions = await fetch_gmx_positions(ctx)
-                    response = f"**Current Portfolio Allocation:**\n\n"
-                    response += f"🥇 Gold: {positions['gold']['weight']*100:.1f}% (${positions['gold']['exposure_usd']:,.0f})\n"
-                    response += f"🥈 Silver: {positions['silver']['weight']*100:.1f}% (${positions['silver']['exposure_usd']:,.0f})\n"
-                    response += f"🛢️ Oil: {positions['oil']['weight']*100:.1f}% (${positions['oil']['exposure_usd']:,.0f})\n"
-                    response += f"💵 Cash Reserve: ${positions['cash']['amount_usd']:,.0f}\n"
-                    response += f"\n📊 Unrealized P&L: ${positions['unrealized_pnl']:,.0f}"
-                    
-                elif "price" in user_query or "cost" in user_query:
-                    prices = await fetch_pyth_prices(ctx)
-                    response = f"**Current Asset Prices:**\n\n"
-                    for asset, data in prices.items():
-                        response += f"{asset.title()}: ${data['price']:,.2f}\n"
-                        
-                elif "market" in user_query or "condition" in user_query:
-                    indicators = await fetch_economic_indicators(ctx)
-                    response = f"**Market Conditions:**\n\n"
-                    response += f"CPI Inflation: {indicators['cpi_annual_rate']}%\n"
-                    response += f"Interest Rate: {indicators['interest_rate']}%\n"
-                    response += f"VIX Volatility: {indicators['vix_volatility']}\n"
-                    response += f"Sentiment: {indicators['market_sentiment'].title()}\n"
-                    response += f"Geopolitical Risk: {indicators['geopolitical_risk'].title()}"
-                    
-                else:
-                    response = "I can help you with portfolio allocation, current prices, or market conditions. Please ask about one of these topics."
+                response = await INTENT_HANDLERS[classify_intent(user_query)](ctx)
                 
                 await ctx.send(sender, create_text_chat(response))
                 
@@ -250,10 +333,19 @@ async def collect_and_broadcast_data(ctx: Context):
     """Periodically collect data and send to Market Intelligence Agent"""
     ctx.logger.info("Starting periodic data collection...")
     
-    # Fetch all data
-    prices = await fetch_pyth_prices(ctx)
-    positions = await fetch_gmx_positions(ctx)
-    indicators = await fetch_economic_indicators(ctx)
+    # Fetch all data concurrently - the three sources are independent
+    results = await asyncio.gather(
+        asyncio.wait_for(fetch_pyth_prices(ctx, force_refresh=True), FETCH_TIMEOUT_SECONDS),
+        asyncio.wait_for(fetch_gmx_positions(ctx, force_refresh=True), FETCH_TIMEOUT_SECONDS),
+        asyncio.wait_for(fetch_economic_indicators(ctx), FETCH_TIMEOUT_SECONDS),
+        return_exceptions=True
+    )
+    for source, result in zip(("prices", "positions", "indicators"), results):
+        if isinstance(result, Exception):
+            ctx.logger.error(f"Error collecting {source}: {result!r}")
+    prices, positions, indicators = (
+        {} if isinstance(result, Exception) else result for result in results
+    )
     
     if prices and positions and indicators:
         # Package data for Market Intelligence Agent
@@ -281,13 +373,26 @@ agent.include(data_collection_proto)
 # Startup handler
 @agent.on_event("startup")
 async def startup(ctx: Context):
+    global http_session
     ctx.logger.info("VGT Data Collection Agent started")
     ctx.logger.info(f"Agent address: {ctx.agent.address}")
+
+    if http_session is None:
+        # Keep-alive pool reused across intervals; the timeout stops a hung endpoint stalling the agent
+        http_session = aiohttp.ClientSession(
+            headers={"Accept": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+        )
     
     # Store Market Intelligence Agent address (set via environment)
     market_intel_addr = os.getenv("MARKET_INTEL_AGENT_ADDRESS")
     if market_intel_addr:
         ctx.storage.set("market_intel_agent_address", market_intel_addr)
 
+@agent.on_event("shutdown")
+async def shutdown(ctx: Context):
+    if http_session is not None:
+        await http_session.close()
+
 if __name__ == "__main__":
     agent.run()
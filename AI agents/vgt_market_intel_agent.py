@@ -19,7 +19,8 @@ agent = Agent(
     port=8002,
     seed=os.getenv("MARKET_INTEL_SEED"),
     mailbox=True,
-    publish_agent_details=True
+    # Internal agent addressed by peers directly; no Agentverse discovery needed
+    publish_agent_details=False
 )
 
 # Models
@@ -19,7 +19,8 @@ agent = Agent(
     port=8003,
     seed=os.getenv("REBALANCER_SEED"),
     mailbox=True,
-    publish_agent_details=True
+    # Internal agent addressed by peers directly; no Agentverse discovery needed
+    publish_agent_details=False
 )
 
 # Models
@@ -58,19 +59,20 @@ async def process_market_analysis(ctx: Context, sender: str, msg: MarketAnalysis
     ctx.logger.info(f"Market regime: {msg.market_regime}, Confidence: {msg.confidence:.2f}")
     
     try:
+        # Cheap numeric guards run before any MeTTa query
+        # Check confidence level
+        if msg.confidence < MIN_CONFIDENCE:
+            ctx.logger.info(f"Confidence {msg.confidence:.2f} below minimum {MIN_CONFIDENCE} - deferring rebalancing")
+            return
+        
         # Check if any adjustment exceeds drift threshold
-        max_adjustment = max(abs(adj) for adj in msg.recommended_adjustments.values())
+        max_adjustment = max(map(abs, msg.recommended_adjustments.values()), default=0.0)
         ctx.logger.info(f"Maximum recommended adjustment: {max_adjustment:.1f}%")
         
         if max_adjustment < DRIFT_THRESHOLD * 100:
             ctx.logger.info(f"No rebalancing needed - max drift {max_adjustment:.1f}% below threshold {DRIFT_THRESHOLD*100}%")
             return
         
-        # Check confidence level
-        if msg.confidence < MIN_CONFIDENCE:
-            ctx.logger.info(f"Confidence {msg.confidence:.2f} below minimum {MIN_CONFIDENCE} - deferring rebalancing")
-            return
-        
         # Use MeTTa to calculate optimal new weights
         new_weights = rebalancing_engine.calculate_optimal_weights(
             msg.market_regime,
@@ -1,17 +1,30 @@
-import time
+import logging
 import uuid
+from time import monotonic_ns
 import structlog
+from django.contrib.auth import SESSION_KEY
 from django.utils.deprecation import MiddlewareMixin
 
 log = structlog.get_logger(__name__)
 
+# Low-value paths that skip request context binding and logging entirely
+SKIP_LOG_PATHS = frozenset({'/favicon.ico', '/robots.txt'})
+# Responses whose timing tells us nothing (no body / not modified)
+SKIP_LOG_STATUS_CODES = frozenset({204, 304})
+
 class StructlogRequestMiddleware(MiddlewareMixin):
     def process_request(self, request):
-        request_id = str(uuid.uuid4())
+        if request.path in SKIP_LOG_PATHS:
+            return
+
+        request_id = uuid.uuid4().hex
 
+        # Read the id from the session rather than resolving the lazy request.user,
+        # which would cost a user lookup on every request.
         user_id = "anonymous"
-        if request.user and request.user.is_authenticated:
-            user_id = request.user.id
+        session = getattr(request, 'session', None)
+        if session is not None:
+            user_id = session.get(SESSION_KEY, user_id)
 
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
@@ -21,18 +34,21 @@ class StructlogRequestMiddleware(MiddlewareMixin):
             user_id=user_id,
         )
 
-        request.start_time = time.time()
+        request.start_time = monotonic_ns()
 
     def process_response(self, request, response):
-        duration = 0
-        if hasattr(request, 'start_time'):
-            duration = (time.time() - request.start_time) * 1000  # in milliseconds
-
-        log.info(
-            "request_finished",
-            status_code=response.status_code,
-            response_time_ms=f"{duration:.2f}",
-        )
+        if not hasattr(request, 'start_time'):
+            # process_request skipped this path, nothing was bound
+            return response
+
+        duration = (monotonic_ns() - request.start_time) / 1_000_000  # in milliseconds
+
+        if response.status_code not in SKIP_LOG_STATUS_CODES and log.isEnabledFor(logging.INFO):
+            log.info(
+                "request_finished",
+                status_code=response.status_code,
+                response_time_ms=round(duration, 2),
+            )
         
         structlog.contextvars.clear_contextvars()
         return response
\ No newline at end of file
@@ -1,6 +1,8 @@
 from rest_framework.permissions import BasePermission
 from apps.users.models import User
 
+_ADMIN_ROLE = User.ROLE_ADMIN
+
 class IsAdminRole(BasePermission):
     """
     Custom permission to only allow users with the 'admin' role.
@@ -8,8 +10,9 @@ class IsAdminRole(BasePermission):
 
     def has_permission(self, request, view):
         # Check if the user is authenticated and has the 'admin' role.
+        user = request.user
         return bool(
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == User.ROLE_ADMIN
+            user and
+            user.is_authenticated and
+            getattr(user, 'role', None) == _ADMIN_ROLE
         )
\ No newline at end of file
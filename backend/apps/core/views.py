@@ -52,8 +52,8 @@ class CacheManagementView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        if key in cache:
-            cache.delete(key)
+        # cache.delete() reports whether the key existed, avoiding a separate lookup
+        if cache.delete(key):
             return Response({"status": f"Cache key '{key}' was successfully deleted."})
         else:
             return Response({"status": f"Cache key '{key}' was not found."}, status=status.HTTP_404_NOT_FOUND)
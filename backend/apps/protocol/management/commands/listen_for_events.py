@@ -1,22 +1,59 @@
 import asyncio
 import structlog
 import time
-from decimal import Decimal
+from collections import defaultdict
+from functools import partial
+from typing import Callable, NamedTuple
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from web3 import Web3, AsyncWeb3
+from django.core.cache import cache
+from eth_utils import event_abi_to_log_topic
+from web3 import Web3, AsyncWeb3, WebSocketProvider
+from web3._utils.events import get_event_data
 from web3.types import EventData, LogReceipt
 from ...models import (
     MintIntent, RedeemIntent, IntentStatus, BasketAllocationUpdate,
     EventListenerState, DepositProcessedEvent, WithdrawalProcessedEvent,
     RebalanceExecutedEvent
 )
-from ...services import AsyncOnChainService, OnChainService
-from ...tasks import update_nav_task, trigger_rebalance_task
+from ...services import BASKET_CACHE_KEYS, AsyncOnChainService, OnChainIntentStatus, OnChainService
+from ...tasks import schedule_nav_update, trigger_rebalance_task
+from ...utils import from_base_units, load_abi
 
 log = structlog.get_logger(__name__)
-DECIMAL_SCALAR = Decimal(10) ** 18
+TOKEN_DECIMALS = 18
+CHECKPOINT_CACHE_KEY = "listener:last_block"
+
+def build_event_abis(abi: list) -> dict[str, tuple[str, dict]]:
+    """Maps each event name in a contract ABI to its raw topic0 bytes and its own ABI entry."""
+    return {
+        item['name']: (event_abi_to_log_topic(item), item)
+        for item in abi if item.get('type') == 'event'
+    }
+
+class HandlerEntry(NamedTuple):
+    """Decoder and handler registered for one event topic."""
+    processor: Callable
+    handler: Callable
+    name: str
+
+# Buffered rows that are upserted on their primary key rather than skipped when they already exist.
+# Intent status is deliberately not overwritten, so replaying a creation event cannot revive a settled intent.
+UPSERT_FIELDS = {
+    MintIntent: ['user', 'deposit_asset', 'deposit_amount', 'locked_nav', 'expected_shield', 'execution_fee', 'expires_at'],
+    RedeemIntent: ['user', 'output_asset', 'shield_amount', 'locked_nav', 'expected_stablecoin', 'execution_fee', 'expires_at'],
+    BasketAllocationUpdate: ['basket_index', 'old_weight_bps', 'new_weight_bps'],
+}
+
+# Events that later events in the same range depend on; these are handled first and in order
+ORDERED_EVENTS = frozenset({'MintIntentCreated', 'RedeemIntentCreated'})
+
+# Computed once per process; decoding needs only the event's ABI entry, not the whole contract ABI
+EVENT_ABIS = {
+    'VaultManager': build_event_abis(load_abi('VaultManager')),
+    'BasketManager': build_event_abis(load_abi('BasketManager')),
+}
 
 class Command(BaseCommand):
     help = 'Starts the robust, asynchronous blockchain event listener using WebSockets.'
@@ -26,6 +63,94 @@ class Command(BaseCommand):
         self.onchain_service = None
         self.event_handlers = {}
         self.contract_addresses = set()
+        self.log_filter = {}
+        self.ordered_topics = frozenset()
+        self.handler_semaphore = None
+        self.last_processed_block = 0
+        self.last_processed_block_hash = ''
+        # Hash of the last block whose logs the node reported as removed, so its burst rescans once
+        self.orphaned_block_hash = None
+        self.last_state_persisted_at = 0.0
+        self.pending_writes = set()
+        # Rows buffered per model and bulk-written in one statement per model
+        self.pending_rows = defaultdict(list)
+        # Task triggers raised by handlers, fired at most once per checkpoint
+        self.needs_nav_update = False
+        self.needs_rebalance = False
+        self.needs_basket_cache_reset = False
+
+    def defer_write(self, coro):
+        """Runs a DB write in the background; it is awaited before the next checkpoint."""
+        task = asyncio.create_task(coro)
+        self.pending_writes.add(task)
+        task.add_done_callback(self.pending_writes.discard)
+
+    async def record_intent_outcome(self, model, intent_id: str, status: IntentStatus):
+        """Moves a claimed intent to its final status with a single conditional UPDATE."""
+        updated = await model.objects.filter(intent_id=intent_id, status=IntentStatus.CLAIMING).aupdate(status=status)
+        if not updated:
+            log.warning("Intent was no longer CLAIMING when recording its outcome.", intent_id=intent_id, status=status)
+
+    async def reclaim_claimed_intents(self):
+        """
+        Resolves intents left CLAIMING by a listener that stopped between claiming and recording the outcome,
+        from the intent's on-chain status: still Pending and unexpired intents are executed again,
+        the rest are settled to match the contract.
+        """
+        for model, getter, execute in (
+            (MintIntent, 'mintIntents', self.onchain_service.execute_mint_intent),
+            (RedeemIntent, 'redeemIntents', self.onchain_service.execute_redeem_intent),
+        ):
+            async for intent in model.objects.filter(status=IntentStatus.CLAIMING).only('intent_id'):
+                intent_id = intent.intent_id
+                try:
+                    onchain = await self.onchain_service.get_intent_status(getter, intent_id)
+                except Exception as e:
+                    # Left CLAIMING; the next start retries the check
+                    log.error("Could not read stale claimed intent on-chain.", intent_id=intent_id, error=str(e))
+                    continue
+
+                if onchain is None:
+                    log.warning("Claimed intent not found on-chain.", intent_id=intent_id)
+                    status = IntentStatus.FAILED
+                else:
+                    onchain_status, expires_at = onchain
+                    expired = time.time() > expires_at
+                    if onchain_status == OnChainIntentStatus.PENDING and not expired:
+                        log.warning("Re-executing intent left CLAIMING by a previous run.", intent_id=intent_id)
+                        try:
+                            await execute(intent_id)
+                        except Exception as e:
+                            log.error("Failed to re-execute claimed intent.", intent_id=intent_id, error=str(e), exc_info=True)
+                            await self.record_intent_outcome(model, intent_id, IntentStatus.FAILED)
+                            continue
+                        status = IntentStatus.PROCESSED
+                        self.needs_nav_update = True
+                    elif onchain_status in (OnChainIntentStatus.PROCESSING, OnChainIntentStatus.COMPLETED):
+                        # The previous run's transaction landed before it could record the outcome
+                        status = IntentStatus.PROCESSED
+                    elif onchain_status in (OnChainIntentStatus.PENDING, OnChainIntentStatus.REFUNDED) and expired:
+                        status = IntentStatus.EXPIRED
+                    else:
+                        # Refunded by the operator before expiry, or cancelled
+                        status = IntentStatus.FAILED
+                    log.info("Resolved stale claimed intent.", intent_id=intent_id, status=status, onchain_status=onchain_status.name)
+                await self.record_intent_outcome(model, intent_id, status)
+
+    async def flush_writes(self):
+        """Bulk-writes buffered rows and waits for deferred writes, re-raising the first failure."""
+        pending_rows, self.pending_rows = self.pending_rows, defaultdict(list)
+        for model, rows in pending_rows.items():
+            if model in UPSERT_FIELDS:
+                await model.objects.abulk_create(
+                    rows, batch_size=500, update_conflicts=True, unique_fields=[model._meta.pk.name],
+                    update_fields=UPSERT_FIELDS[model],
+                )
+            else:
+                # Replayed ranges re-emit rows we already hold; the tx hash PK makes them no-ops
+                await model.objects.abulk_create(rows, batch_size=500, ignore_conflicts=True)
+        if self.pending_writes:
+            await asyncio.gather(*self.pending_writes)
 
     # --- Event Handlers ---
 
@@ -33,56 +158,54 @@ class Command(BaseCommand):
         args = event.args
         intent_id_hex = args.intentId.hex()
         log.info("Handler: New MintIntentCreated event received.", intent_id=intent_id_hex)
-        await MintIntent.objects.aupdate_or_create(
+        intent = MintIntent(
             intent_id=intent_id_hex,
-            defaults={
-                'user': args.user,
-                'deposit_asset': args.depositAsset,
-                'deposit_amount': Decimal(args.depositAmount) / DECIMAL_SCALAR,
-                'locked_nav': Decimal(args.lockedNAV) / DECIMAL_SCALAR,
-                'expected_shield': Decimal(args.expectedShield) / DECIMAL_SCALAR,
-                'execution_fee': Decimal(args.executionFee) / DECIMAL_SCALAR,
-                'expires_at': args.expiresAt,
-                'status': IntentStatus.PENDING,
-            }
+            user=args.user,
+            deposit_asset=args.depositAsset,
+            deposit_amount=from_base_units(args.depositAmount, TOKEN_DECIMALS),
+            locked_nav=from_base_units(args.lockedNAV, TOKEN_DECIMALS),
+            expected_shield=from_base_units(args.expectedShield, TOKEN_DECIMALS),
+            execution_fee=from_base_units(args.executionFee, TOKEN_DECIMALS),
+            expires_at=args.expiresAt,
+            status=IntentStatus.PENDING,
         )
-        log.info("Mint intent saved to database.", intent_id=intent_id_hex)
+        self.pending_rows[MintIntent].append(intent)
+        log.info("Mint intent queued for database.", intent_id=intent_id_hex)
 
     async def handle_redeem_intent_created(self, event: EventData):
         args = event.args
         intent_id_hex = args.intentId.hex()
         log.info("Handler: New RedeemIntentCreated event received.", intent_id=intent_id_hex)
-        await RedeemIntent.objects.aupdate_or_create(
+        intent = RedeemIntent(
             intent_id=intent_id_hex,
-            defaults={
-                'user': args.user,
-                'output_asset': args.outputAsset,
-                'shield_amount': Decimal(args.shieldAmount) / DECIMAL_SCALAR,
-                'locked_nav': Decimal(args.lockedNAV) / DECIMAL_SCALAR,
-                'expected_stablecoin': Decimal(args.expectedStablecoin) / DECIMAL_SCALAR,
-                'execution_fee': Decimal(args.executionFee) / DECIMAL_SCALAR,
-                'expires_at': args.expiresAt,
-                'status': IntentStatus.PENDING,
-            }
+            user=args.user,
+            output_asset=args.outputAsset,
+            shield_amount=from_base_units(args.shieldAmount, TOKEN_DECIMALS),
+            locked_nav=from_base_units(args.lockedNAV, TOKEN_DECIMALS),
+            expected_stablecoin=from_base_units(args.expectedStablecoin, TOKEN_DECIMALS),
+            execution_fee=from_base_units(args.executionFee, TOKEN_DECIMALS),
+            expires_at=args.expiresAt,
+            status=IntentStatus.PENDING,
         )
-        log.info("Redeem intent saved to database.", intent_id=intent_id_hex)
+        self.pending_rows[RedeemIntent].append(intent)
+        log.info("Redeem intent queued for database.", intent_id=intent_id_hex)
 
     async def handle_deposit_processed(self, event: EventData):
         args = event.args
         tx_hash = event.transactionHash.hex()
-        log.info("Handler: DepositProcessed event received.", args=args)
+        log.info("Handler: DepositProcessed event received.", deposit_id=args.depositId, user=args.user, amount=args.amount, success=args.success)
         
-        # Save the event for audit trail
-        await DepositProcessedEvent.objects.acreate(
+        # Buffer the event for the audit trail; flushed in bulk at the next checkpoint
+        self.pending_rows[DepositProcessedEvent].append(DepositProcessedEvent(
             transaction_hash=tx_hash,
             deposit_id=args.depositId,
             user=args.user,
-            amount=Decimal(args.amount) / DECIMAL_SCALAR,
+            amount=from_base_units(args.amount, TOKEN_DECIMALS),
             success=args.success
-        )
+        ))
 
         if not args.success:
-            log.warning("DepositProcessed event reported failure.", args=args)
+            log.warning("DepositProcessed event reported failure.", deposit_id=args.depositId, tx_hash=tx_hash)
             return
 
         # Find the original intentId by calling the contract
@@ -91,41 +214,40 @@ class Command(BaseCommand):
             log.warning("Could not find associated intentId for deposit.", deposit_id=args.depositId)
             return
 
-        matching_intent = await MintIntent.objects.filter(intent_id=intent_id_hex, status=IntentStatus.PENDING).afirst()
-        if not matching_intent:
-            log.warning("Found intentId but no matching PENDING intent in DB.", intent_id=intent_id_hex, deposit_id=args.depositId)
+        # Claim the intent atomically so a replayed event or a second listener cannot execute it twice
+        claimed = await MintIntent.objects.filter(intent_id=intent_id_hex, status=IntentStatus.PENDING).aupdate(status=IntentStatus.CLAIMING)
+        if not claimed:
+            log.warning("Found intentId but no PENDING intent to claim in DB.", intent_id=intent_id_hex, deposit_id=args.depositId)
             return
 
-        log.info("Found matching mint intent, proceeding to execute.", intent_id=matching_intent.intent_id)
+        log.info("Claimed mint intent, proceeding to execute.", intent_id=intent_id_hex)
         try:
-            await self.onchain_service.execute_mint_intent(matching_intent.intent_id)
-            matching_intent.status = IntentStatus.PROCESSED
-            await matching_intent.asave()
-            log.info("Successfully executed mint intent.", intent_id=matching_intent.intent_id)
+            await self.onchain_service.execute_mint_intent(intent_id_hex)
+            self.defer_write(self.record_intent_outcome(MintIntent, intent_id_hex, IntentStatus.PROCESSED))
+            log.info("Successfully executed mint intent.", intent_id=intent_id_hex)
             
-            # Trigger immediate NAV update
-            update_nav_task.delay(trigger_source=f"mint_completed_{matching_intent.intent_id[:10]}")
+            # NAV update is triggered once the range is checkpointed
+            self.needs_nav_update = True
         except Exception as e:
-            log.error("Failed to execute mint intent on-chain.", intent_id=matching_intent.intent_id, error=str(e), exc_info=True)
-            matching_intent.status = IntentStatus.FAILED
-            await matching_intent.asave()
+            log.error("Failed to execute mint intent on-chain.", intent_id=intent_id_hex, error=str(e), exc_info=True)
+            self.defer_write(self.record_intent_outcome(MintIntent, intent_id_hex, IntentStatus.FAILED))
 
     async def handle_withdrawal_processed(self, event: EventData):
         args = event.args
         tx_hash = event.transactionHash.hex()
-        log.info("Handler: WithdrawalProcessed event received.", args=args)
+        log.info("Handler: WithdrawalProcessed event received.", withdrawal_id=args.withdrawalId, user=args.user, amount=args.amount, success=args.success)
 
-        # Save the event for audit trail
-        await WithdrawalProcessedEvent.objects.acreate(
+        # Buffer the event for the audit trail; flushed in bulk at the next checkpoint
+        self.pending_rows[WithdrawalProcessedEvent].append(WithdrawalProcessedEvent(
             transaction_hash=tx_hash,
             withdrawal_id=args.withdrawalId,
             user=args.user,
-            amount=Decimal(args.amount) / DECIMAL_SCALAR,
+            amount=from_base_units(args.amount, TOKEN_DECIMALS),
             success=args.success
-        )
+        ))
 
         if not args.success:
-            log.warning("WithdrawalProcessed event reported failure.", args=args)
+            log.warning("WithdrawalProcessed event reported failure.", withdrawal_id=args.withdrawalId, tx_hash=tx_hash)
             return
 
         # Find the original intentId by calling the contract
@@ -134,154 +256,316 @@ class Command(BaseCommand):
             log.warning("Could not find associated intentId for withdrawal.", withdrawal_id=args.withdrawalId)
             return
 
-        matching_intent = await RedeemIntent.objects.filter(intent_id=intent_id_hex, status=IntentStatus.PENDING).afirst()
-        if not matching_intent:
-            log.warning("Found intentId but no matching PENDING intent in DB.", intent_id=intent_id_hex, withdrawal_id=args.withdrawalId)
+        # Claim the intent atomically so a replayed event or a second listener cannot execute it twice
+        claimed = await RedeemIntent.objects.filter(intent_id=intent_id_hex, status=IntentStatus.PENDING).aupdate(status=IntentStatus.CLAIMING)
+        if not claimed:
+            log.warning("Found intentId but no PENDING intent to claim in DB.", intent_id=intent_id_hex, withdrawal_id=args.withdrawalId)
             return
             
-        log.info("Found matching redeem intent, proceeding to execute.", intent_id=matching_intent.intent_id)
+        log.info("Claimed redeem intent, proceeding to execute.", intent_id=intent_id_hex)
         try:
-            await self.onchain_service.execute_redeem_intent(matching_intent.intent_id)
-            matching_intent.status = IntentStatus.PROCESSED
-            await matching_intent.asave()
-            log.info("Successfully executed redeem intent.", intent_id=matching_intent.intent_id)
+            await self.onchain_service.execute_redeem_intent(intent_id_hex)
+            self.defer_write(self.record_intent_outcome(RedeemIntent, intent_id_hex, IntentStatus.PROCESSED))
+            log.info("Successfully executed redeem intent.", intent_id=intent_id_hex)
             
-            # Trigger immediate NAV update
-            update_nav_task.delay(trigger_source=f"redeem_completed_{matching_intent.intent_id[:10]}")
+            # NAV update is triggered once the range is checkpointed
+            self.needs_nav_update = True
         except Exception as e:
-            log.error("Failed to execute redeem intent on-chain.", intent_id=matching_intent.intent_id, error=str(e), exc_info=True)
-            matching_intent.status = IntentStatus.FAILED
-            await matching_intent.asave()
+            log.error("Failed to execute redeem intent on-chain.", intent_id=intent_id_hex, error=str(e), exc_info=True)
+            self.defer_write(self.record_intent_outcome(RedeemIntent, intent_id_hex, IntentStatus.FAILED))
 
     async def handle_basket_allocation_updated(self, event: EventData):
         args = event.args
         tx_hash = event.transactionHash.hex()
-        log.info("Handler: BasketAllocationUpdated event received.", args=args, tx_hash=tx_hash)
+        log.info("Handler: BasketAllocationUpdated event received.", basket_index=args.basketIndex, new_weight_bps=args.newWeightBps, tx_hash=tx_hash)
 
-        await BasketAllocationUpdate.objects.aupdate_or_create(
+        self.pending_rows[BasketAllocationUpdate].append(BasketAllocationUpdate(
             transaction_hash=tx_hash,
-            defaults={
-                'basket_index': args.basketIndex,
-                'old_weight_bps': args.oldWeightBps,
-                'new_weight_bps': args.newWeightBps,
-            }
-        )
-        log.info("Basket allocation update saved to database. Triggering rebalance task with cooldown.", tx_hash=tx_hash)
-        
-        # Trigger the delayed rebalance task
-        trigger_rebalance_task.apply_async()
+            basket_index=args.basketIndex,
+            old_weight_bps=args.oldWeightBps,
+            new_weight_bps=args.newWeightBps,
+        ))
+        log.info("Basket allocation update queued for database. Rebalance task will be triggered with cooldown.", tx_hash=tx_hash)
+        self.needs_rebalance = True
 
     async def handle_rebalance_executed(self, event: EventData):
         args = event.args
         tx_hash = event.transactionHash.hex()
-        log.info("Handler: RebalanceExecuted event received.", args=args, tx_hash=tx_hash)
+        log.info("Handler: RebalanceExecuted event received.", from_token=args.fromToken, to_token=args.toToken, amount=args.amount, tx_hash=tx_hash)
 
-        await RebalanceExecutedEvent.objects.acreate(
+        self.pending_rows[RebalanceExecutedEvent].append(RebalanceExecutedEvent(
             transaction_hash=tx_hash,
             from_token=args.fromToken,
             to_token=args.toToken,
-            amount=Decimal(args.amount) / DECIMAL_SCALAR,
+            amount=from_base_units(args.amount, TOKEN_DECIMALS),
             timestamp=args.timestamp
-        )
-        log.info("Rebalance execution saved to database. Triggering immediate NAV update.", tx_hash=tx_hash)
+        ))
+        log.info("Rebalance execution queued for database. NAV update will be triggered.", tx_hash=tx_hash)
 
-        # Trigger immediate NAV update as positions have changed
-        update_nav_task.delay(trigger_source=f"rebalance_executed_{tx_hash[:10]}")
+        # Positions have changed, so NAV must be recomputed
+        self.needs_nav_update = True
 
+    async def handle_position_keys_changed(self, event: EventData):
+        """PositionOpened/PositionClosed/BasketAllocationAdded change the keys NAV runs read."""
+        log.info("Handler: basket position keys changed.", event_name=event.event, tx_hash=event.transactionHash.hex())
+        self.needs_basket_cache_reset = True
 
     # --- Core Processing Logic ---
-    # ... (process_log and process_block methods remain the same as the previous async version)
     async def process_log(self, w3: Web3, log_entry: LogReceipt):
         """Decodes a single log and calls the appropriate handler."""
-        topic = log_entry['topics'][0].hex()
-        if topic in self.event_handlers:
-            contract_abi = self.event_handlers[topic]['abi']
-            event_name = self.event_handlers[topic]['name']
-            
-            # The event must be retrieved from the contract object to be decoded
-            contract_obj = w3.eth.contract(abi=contract_abi)
-            event_obj = getattr(contract_obj.events, event_name)
-            
-            try:
-                decoded_event = event_obj().process_log(log_entry)
-                handler_func = self.event_handlers[topic]['handler']
-                await handler_func(decoded_event)
-            except Exception as e:
-                log.error("Failed to decode or handle event", log=log_entry, error=e, exc_info=True)
-
-    async def process_block(self, w3: Web3, block_number: int):
-        """Fetches a block and processes all relevant logs within it."""
-        log.info("Processing block", block_number=block_number)
+        # Handlers are keyed by raw topic bytes, so the HexBytes topic is looked up without hex-encoding
+        entry = self.event_handlers.get(log_entry['topics'][0])
+        if entry is None:
+            return
         try:
-            block = await w3.eth.get_block(block_number, full_transactions=True)
-            for tx in block['transactions']:
-                receipt = await w3.eth.get_transaction_receipt(tx['hash'])
-                for log_entry in receipt['logs']:
-                    if log_entry['address'] in self.contract_addresses:
-                        await self.process_log(w3, log_entry)
-            
-            await EventListenerState.objects.aupdate_or_create(
-                pk=1, defaults={'last_processed_block': block_number}
-            )
+            await entry.handler(entry.processor(log_entry))
         except Exception as e:
-            log.error("Failed to process block", block_number=block_number, error=e, exc_info=True)
+            log.error("Failed to decode or handle event", log=log_entry, error=e, exc_info=True)
+
+    async def process_log_bounded(self, w3: Web3, log_entry: LogReceipt):
+        """Runs process_log under the listener-wide handler concurrency limit."""
+        async with self.handler_semaphore:
+            await self.process_log(w3, log_entry)
+
+    async def fetch_logs(self, w3: Web3, from_block: int, to_block: int) -> list[LogReceipt]:
+        """Fetches our contracts' logs for a block range in one eth_getLogs call."""
+        return await w3.eth.get_logs({**self.log_filter, 'fromBlock': from_block, 'toBlock': to_block})
+
+    async def checkpoint(self, w3: Web3, block_number: int, block_hash: str | None = None):
+        """Persists block_number (and its hash) as processed once all deferred writes have landed."""
+        await self.flush_writes()
+        if block_hash is None:
+            block_hash = Web3.to_hex((await w3.eth.get_block(block_number))['hash'])
+        # The cache takes every checkpoint; the database copy is only a periodic durable snapshot,
+        # and anything replayed from an older snapshot is idempotent.
+        await cache.aset(CHECKPOINT_CACHE_KEY, (block_number, block_hash), timeout=None)
+        self.last_processed_block = block_number
+        self.last_processed_block_hash = block_hash
+        if time.monotonic() - self.last_state_persisted_at >= settings.EVENT_LISTENER_STATE_PERSIST_INTERVAL_SECONDS:
+            await self.persist_state()
+        await self.dispatch_tasks(block_number)
+
+    async def persist_state(self):
+        """Copies the in-memory checkpoint to EventListenerState."""
+        # The state row is created once in listen(), so a plain UPDATE suffices here
+        await EventListenerState.objects.filter(pk=1).aupdate(
+            last_processed_block=self.last_processed_block, last_processed_block_hash=self.last_processed_block_hash
+        )
+        self.last_state_persisted_at = time.monotonic()
+
+    async def dispatch_tasks(self, block_number: int):
+        """Fires each task requested by handlers since the last checkpoint exactly once."""
+        # Redis and broker round-trips are blocking calls; keep them off the event loop
+        if self.needs_basket_cache_reset:
+            # Dropped before any NAV task is queued so that run re-reads the new keys
+            self.needs_basket_cache_reset = False
+            await cache.adelete_many(BASKET_CACHE_KEYS)
+        if self.needs_nav_update:
+            self.needs_nav_update = False
+            await asyncio.to_thread(schedule_nav_update, trigger_source=f"batch_{block_number}")
+        if self.needs_rebalance:
+            self.needs_rebalance = False
+            await asyncio.to_thread(trigger_rebalance_task.apply_async)
+
+    async def rewind_on_reorg(self, w3: Web3):
+        """Steps the checkpoint back if the last processed block is no longer canonical."""
+        if not self.last_processed_block_hash:
+            return
+        block = await w3.eth.get_block(self.last_processed_block)
+        if Web3.to_hex(block['hash']) == self.last_processed_block_hash:
+            return
+
+        rewind_to = max(self.last_processed_block - max(settings.EVENT_LISTENER_CONFIRMATIONS, 1), 0)
+        log.warning("Chain reorganisation detected; rewinding checkpoint.", from_block=self.last_processed_block, to_block=rewind_to)
+        # Replayed audit rows are idempotent, so re-scanning the rewound blocks is safe
+        self.last_processed_block = rewind_to
+        self.last_processed_block_hash = ''
+
+    async def process_block_range(self, w3: Web3, from_block: int, to_block: int, logs: list[LogReceipt]):
+        """Processes a block range's logs in order, then checkpoints the range."""
+        log.info("Processing blocks", from_block=from_block, to_block=to_block, log_count=len(logs))
+        # Intent creations are cheap writes that deposit/withdrawal handlers rely on, so they
+        # go first; the remaining handlers are independent RPC/DB work and overlap.
+        independent_logs = []
+        for log_entry in logs:
+            if log_entry['topics'][0] in self.ordered_topics:
+                await self.process_log(w3, log_entry)
+            else:
+                independent_logs.append(log_entry)
+        # Insert this range's intents before anything can update their status
+        await self.flush_writes()
+        await asyncio.gather(*(self.process_log_bounded(w3, log_entry) for log_entry in independent_logs))
+
+        await self.checkpoint(w3, to_block)
+
+    async def catch_up(self, w3: Web3, latest_block: int):
+        """Processes all confirmed blocks after the last processed one, one bounded eth_getLogs range at a time."""
+        latest_block -= settings.EVENT_LISTENER_CONFIRMATIONS
+        if latest_block <= self.last_processed_block:
+            return
+        await self.rewind_on_reorg(w3)
+        log.info("New blocks detected.", from_block=self.last_processed_block + 1, to_block=latest_block)
+
+        max_range = settings.EVENT_LISTENER_MAX_BLOCK_RANGE
+        ranges = [
+            (from_block, min(from_block + max_range - 1, latest_block))
+            for from_block in range(self.last_processed_block + 1, latest_block + 1, max_range)
+        ]
+
+        # Fetch up to N ranges concurrently, but process and checkpoint them strictly in
+        # order so a failure never leaves a gap behind last_processed_block.
+        semaphore = asyncio.Semaphore(settings.EVENT_LISTENER_FETCH_CONCURRENCY)
+
+        async def fetch(from_block: int, to_block: int) -> list[LogReceipt]:
+            async with semaphore:
+                return await self.fetch_logs(w3, from_block, to_block)
+
+        fetches = [asyncio.create_task(fetch(*block_range)) for block_range in ranges]
+        try:
+            for (from_block, to_block), fetch_task in zip(ranges, fetches):
+                await self.process_block_range(w3, from_block, to_block, await fetch_task)
+        finally:
+            for fetch_task in fetches:
+                fetch_task.cancel()
+
+    async def follow_new_heads(self, w3: Web3):
+        """Processes newly confirmed blocks as the node pushes their headers over the WebSocket subscription."""
+        async for payload in w3.socket.process_subscriptions():
+            await self.catch_up(w3, payload['result']['number'])
+
+    async def rescan_after_removed_log(self, w3: Web3, block_number: int):
+        """
+        Rewinds the checkpoint to just before a block the node reported as orphaned and re-scans
+        up to the head, so the canonical replacement's logs are handled. As with rewind_on_reorg,
+        replayed rows are idempotent; rows already written from the orphaned block are kept.
+        """
+        rewind_to = min(self.last_processed_block, block_number - 1)
+        log.warning("Log removed by a chain reorganisation; rewinding checkpoint.", block_number=block_number, to_block=rewind_to)
+        await self.flush_writes()
+        self.last_processed_block = rewind_to
+        self.last_processed_block_hash = ''
+        await self.catch_up(w3, await w3.eth.block_number)
+
+    async def follow_logs(self, w3: Web3):
+        """Processes our contracts' logs as the node pushes them over the WebSocket subscription."""
+        async for payload in w3.socket.process_subscriptions():
+            log_entry = payload['result']
+            block_number = log_entry['blockNumber']
+            if log_entry.get('removed'):
+                # Checked before the covered-range skip: the orphaned block was processed on arrival
+                block_hash = Web3.to_hex(log_entry['blockHash'])
+                if block_hash != self.orphaned_block_hash:
+                    self.orphaned_block_hash = block_hash
+                    await self.rescan_after_removed_log(w3, block_number)
+                continue
+            if block_number <= self.last_processed_block:
+                # Already covered by the catch-up scan that ran after subscribing
+                continue
+
+            # Logs arrive in chain order, so every block before this one is complete
+            if block_number - 1 > self.last_processed_block:
+                await self.checkpoint(w3, block_number - 1)
+            await self.process_log(w3, log_entry)
+            await self.flush_writes()
+            # The block's checkpoint only comes with a later block's log, which may never arrive;
+            # fire the requested tasks now (the NAV update is debounced across the block's logs)
+            await self.dispatch_tasks(block_number)
+
+    async def poll_new_blocks(self, w3: Web3):
+        """Fallback for nodes without a WebSocket endpoint: polls the head block over HTTP."""
+        while True:
+            try:
+                await self.catch_up(w3, await w3.eth.block_number)
+
+                # Wait for a short interval before checking again
+                await asyncio.sleep(settings.EVENT_LISTENER_POLL_INTERVAL_SECONDS)
+
+            except Exception as e:
+                log.error("Error in polling loop. Retrying...", error=str(e), exc_info=True)
+                await asyncio.sleep(settings.EVENT_LISTENER_ERROR_POLL_INTERVAL_SECONDS)
 
     # --- Main Asynchronous Loop ---
-    async def main_loop(self):
-        w3_http = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(settings.NODE_RPC_URL))
-        self.onchain_service = AsyncOnChainService(w3=w3_http)
+    async def listen(self, w3: Web3):
+        self.onchain_service = AsyncOnChainService(w3=w3)
         
         contracts = {
-            self.onchain_service.vault_manager_contract: [
+            'VaultManager': (self.onchain_service.vault_manager_contract, [
                 ('MintIntentCreated', self.handle_mint_intent_created),
                 ('RedeemIntentCreated', self.handle_redeem_intent_created)
-            ],
-            self.onchain_service.basket_manager_contract: [
+            ]),
+            'BasketManager': (self.onchain_service.basket_manager_contract, [
                 ('DepositProcessed', self.handle_deposit_processed),
                 ('WithdrawalProcessed', self.handle_withdrawal_processed),
                 ('BasketAllocationUpdated', self.handle_basket_allocation_updated),
-                ('RebalanceExecuted', self.handle_rebalance_executed)
-            ]
+                ('RebalanceExecuted', self.handle_rebalance_executed),
+                ('BasketAllocationAdded', self.handle_position_keys_changed),
+                ('PositionOpened', self.handle_position_keys_changed),
+                ('PositionClosed', self.handle_position_keys_changed),
+            ])
         }
         self.contract_addresses.clear()
         self.event_handlers.clear()
-        for contract, events in contracts.items():
+        for abi_name, (contract, events) in contracts.items():
             self.contract_addresses.add(contract.address)
             for event_name, handler in events:
-                event_abi = next((abi for abi in contract.abi if abi.get('name') == event_name and abi.get('type') == 'event'), None)
-                if event_abi:
-                    input_types = [inp['type'] for inp in event_abi['inputs']]
-                    topic_hash = w3_http.keccak(text=f"{event_name}({','.join(input_types)})").hex()
-                    self.event_handlers[topic_hash] = {
-                        'name': event_name,
-                        'handler': handler,
-                        'abi': contract.abi
-                    }
-
-        latest_block = await w3_http.eth.block_number
-        state, _ = await EventListenerState.objects.aget_or_create(pk=1, defaults={'last_processed_block': await w3_http.eth.block_number})
-        last_processed_block = state.last_processed_block
+                if event_name in EVENT_ABIS[abi_name]:
+                    topic_hash, event_abi = EVENT_ABIS[abi_name][event_name]
+                    # Bind the event decoder once here rather than rebuilding a contract per log
+                    self.event_handlers[topic_hash] = HandlerEntry(
+                        processor=partial(get_event_data, w3.codec, event_abi),
+                        handler=handler,
+                        name=event_name,
+                    )
+        self.ordered_topics = frozenset(
+            topic for topic, entry in self.event_handlers.items() if entry.name in ORDERED_EVENTS
+        )
+        self.handler_semaphore = asyncio.Semaphore(settings.EVENT_LISTENER_CONCURRENCY)
+        # Address and topic0 filter shared by every eth_getLogs call; the node does the filtering
+        self.log_filter = {
+            'address': list(self.contract_addresses),
+            'topics': [[Web3.to_hex(topic) for topic in self.event_handlers]],
+        }
 
-        while True:
-            try:
-                latest_block = await w3_http.eth.block_number
-                
-                # If new blocks have been mined since the last check
-                if latest_block > last_processed_block:
-                    log.info("New blocks detected.", from_block=last_processed_block + 1, to_block=latest_block)
-                    
-                    # Process all blocks from the last processed one up to the latest
-                    for block_num in range(last_processed_block + 1, latest_block + 1):
-                        await self.process_block(w3_http, block_num)
-                    
-                    last_processed_block = latest_block
+        websocket = isinstance(w3.provider, WebSocketProvider)
+        if websocket:
+            # Subscribe before reading the head so nothing mined during the catch-up scan is
+            # missed; the provider buffers pushed messages until we start consuming them.
+            if settings.EVENT_LISTENER_CONFIRMATIONS:
+                # Pushed logs are unconfirmed, so follow headers and scan confirmed ranges instead
+                await w3.eth.subscribe('newHeads')
+            else:
+                await w3.eth.subscribe('logs', self.log_filter)
 
-                # Wait for a short interval before checking again
-                await asyncio.sleep(settings.EVENT_LISTENER_POLL_INTERVAL_SECONDS)
+        # One head read serves both the first-boot default and the catch-up scan
+        latest_block = await w3.eth.block_number
+        state, _ = await EventListenerState.objects.aget_or_create(pk=1, defaults={'last_processed_block': latest_block})
+        # Prefer the cached checkpoint, which is newer than the periodic database snapshot
+        self.last_processed_block, self.last_processed_block_hash = await cache.aget(
+            CHECKPOINT_CACHE_KEY, (state.last_processed_block, state.last_processed_block_hash)
+        )
 
-            except Exception as e:
-                log.error("Error in polling loop. Retrying...", error=str(e), exc_info=True)
-                await asyncio.sleep(settings.EVENT_LISTENER_ERROR_POLL_INTERVAL_SECONDS)
+        # Settle intents orphaned by a crash or reconnect before new events can claim more
+        await self.reclaim_claimed_intents()
+        await self.dispatch_tasks(latest_block)
+
+        if websocket:
+            await self.catch_up(w3, latest_block)
+            if settings.EVENT_LISTENER_CONFIRMATIONS:
+                await self.follow_new_heads(w3)
+            else:
+                await self.follow_logs(w3)
+        else:
+            await self.poll_new_blocks(w3)
+
+    async def main_loop(self):
+        if settings.NODE_WS_URL:
+            # One persistent socket serves both the logs subscription and every data-plane call;
+            # errors close it and handle() reconnects.
+            async with AsyncWeb3(WebSocketProvider(settings.NODE_WS_URL)) as w3_ws:
+                await self.listen(w3_ws)
+        else:
+            w3_http = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(settings.NODE_RPC_URL))
+            await self.listen(w3_http)
 
     def handle(self, *args, **options):
         # The outer while True loop for reconnection is no longer strictly necessary
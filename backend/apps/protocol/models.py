@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 import uuid
 
 class GMXPosition(models.Model):
@@ -16,6 +17,7 @@ class GMXPosition(models.Model):
 
 class IntentStatus(models.TextChoices):
     PENDING = 'PENDING', 'Pending'
+    CLAIMING = 'CLAIMING', 'Claiming'
     PROCESSED = 'PROCESSED', 'Processed'
     FAILED = 'FAILED', 'Failed'
     EXPIRED = 'EXPIRED', 'Expired'
@@ -38,12 +40,17 @@ class MintIntent(models.Model):
         max_length=10,
         choices=IntentStatus.choices,
         default=IntentStatus.PENDING,
-        db_index=True
     )
 
     def __str__(self):
         return f"{self.intent_id} ({self.status})"
 
+    class Meta:
+        # Settled intents accumulate forever; only the bounded PENDING set is ever scanned by status
+        indexes = [
+            models.Index(fields=['status'], name='mintintent_pending_idx', condition=Q(status=IntentStatus.PENDING)),
+        ]
+
 class RedeemIntent(models.Model):
     """
     Stores data from the Vault contract's RedeemIntentCreated event.
@@ -62,12 +69,17 @@ class RedeemIntent(models.Model):
         max_length=10,
         choices=IntentStatus.choices,
         default=IntentStatus.PENDING,
-        db_index=True
     )
 
     def __str__(self):
         return f"{self.intent_id} ({self.status})"
 
+    class Meta:
+        # Settled intents accumulate forever; only the bounded PENDING set is ever scanned by status
+        indexes = [
+            models.Index(fields=['status'], name='redeemintent_pending_idx', condition=Q(status=IntentStatus.PENDING)),
+        ]
+
 class ProtocolState(models.Model):
     """
     A singleton-like model to store global protocol state variables.
@@ -105,10 +117,16 @@ class EventListenerState(models.Model):
     """
     id = models.PositiveSmallIntegerField(primary_key=True, default=1, editable=False)
     last_processed_block = models.PositiveIntegerField()
+    last_processed_block_hash = models.CharField(max_length=66, blank=True, default='', help_text="Hash of last_processed_block, used to detect reorgs.")
 
     def __str__(self):
         return f"Event Listener State (Last Block: {self.last_processed_block})"
     
+class TxStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pending'
+    CONFIRMED = 'CONFIRMED', 'Confirmed'
+    FAILED = 'FAILED', 'Failed'
+
 class NAVUpdateLog(models.Model):
     """
     Stores a historical log of each NAV calculation performed by the backend.
@@ -116,6 +134,12 @@ class NAVUpdateLog(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     total_position_size = models.DecimalField(max_digits=78, decimal_places=18)
     onchain_tx_hash = models.CharField(max_length=66, null=True, blank=True, help_text="Tx hash of the on-chain NAV update.")
+    status = models.CharField(
+        max_length=10,
+        choices=TxStatus.choices,
+        default=TxStatus.PENDING,
+        help_text="Inclusion status of onchain_tx_hash, set by the verify_nav_submissions task.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -123,6 +147,9 @@ class NAVUpdateLog(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status'], name='navupdatelog_pending_idx', condition=Q(status=TxStatus.PENDING)),
+        ]
 
 
 class DepositProcessedEvent(models.Model):
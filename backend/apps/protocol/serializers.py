@@ -6,6 +6,17 @@ class GMXPositionSerializer(serializers.ModelSerializer):
         model = GMXPosition
         fields = ['position_id', 'is_closed', 'created_at', 'updated_at']
 
+    def to_representation(self, instance):
+        # Build the row directly instead of walking DRF's generic per-field loop for every list item;
+        # timestamps still go through the declared fields so their formatting is unchanged.
+        fields = self.fields
+        return {
+            'position_id': instance.position_id,
+            'is_closed': instance.is_closed,
+            'created_at': fields['created_at'].to_representation(instance.created_at),
+            'updated_at': fields['updated_at'].to_representation(instance.updated_at),
+        }
+
 class HeartbeatSerializer(serializers.Serializer):
     heartbeat_seconds = serializers.IntegerField(min_value=300)
 
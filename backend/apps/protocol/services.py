@@ -1,34 +1,171 @@
+import asyncio
+import threading
 import time
+import requests
 import structlog
+from aiohttp import ClientTimeout
+from collections import OrderedDict
+from enum import IntEnum
+from contextlib import asynccontextmanager, nullcontext
+from functools import lru_cache
 from web3 import AsyncWeb3, Web3
+from web3.exceptions import ContractLogicError, TimeExhausted, TransactionNotFound
 from web3.middleware import ExtraDataToPOAMiddleware
 from eth_account import Account
 from eth_account.messages import encode_defunct
-from decimal import Decimal, getcontext
+from eth_utils import keccak
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+from hexbytes import HexBytes
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .models import GMXPosition, NAVUpdateLog
-from .utils import load_abi
+from .models import NAVUpdateLog, TxStatus
+from .utils import from_base_units, load_abi
 
 log = structlog.get_logger(__name__)
 
-# Set precision for Decimal calculations
-getcontext().prec = 50
-
-# Decimal Constants for conversion
+# Integer constants for conversion; NAV math is exact int arithmetic in GMX's 30-decimal USD units
 GMX_DECIMALS = 30
 USDC_DECIMALS = 6
 TARGET_DECIMALS = 18
-GMX_SCALAR = Decimal(10) ** (GMX_DECIMALS - TARGET_DECIMALS)
-USDC_SCALAR = Decimal(10) ** (TARGET_DECIMALS - USDC_DECIMALS)
-WEI_SCALAR = Decimal(10) ** TARGET_DECIMALS
+GMX_TO_TARGET_DIV = 10 ** (GMX_DECIMALS - TARGET_DECIMALS)
+USDC_TO_GMX_MUL = 10 ** (GMX_DECIMALS - USDC_DECIMALS)
+WEI = 10 ** TARGET_DECIMALS
+
+def _checksum(address: str | None) -> str | None:
+    return Web3.to_checksum_address(address) if address else address
+
+# Checksummed once at import rather than on every contract build or call argument
+VAULT_MANAGER_ADDRESS = _checksum(settings.VAULT_MANAGER_CONTRACT_ADDRESS)
+BASKET_MANAGER_ADDRESS = _checksum(settings.BASKET_MANAGER_CONTRACT_ADDRESS)
+BASKET_ORACLE_ADDRESS = _checksum(settings.BASKET_ORACLE_CONTRACT_ADDRESS)
+GMX_READER_ADDRESS = _checksum(settings.GMX_READER_CONTRACT_ADDRESS)
+GMX_DATA_STORE_ADDRESS = _checksum(settings.GMX_DATA_STORE_ADDRESS)
+USDC_ADDRESS = _checksum(settings.USDC_ADDRESS)
+MULTICALL3_ADDRESS = _checksum(settings.MULTICALL3_ADDRESS)
+NAV_AGGREGATOR_ADDRESS = _checksum(settings.NAV_AGGREGATOR_ADDRESS)
+
+class OnChainIntentStatus(IntEnum):
+    """VaultManager.IntentStatus, in declaration order."""
+    PENDING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    REFUNDED = 3
+    CANCELLED = 4
+
+# Positions of expiresAt and status in the mintIntents/redeemIntents getter outputs
+INTENT_EXPIRES_AT_INDEX = 9
+INTENT_STATUS_INDEX = 10
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Upper bound on remembered depositId/withdrawalId -> intentId mappings
+INTENT_ID_CACHE_SIZE = 50_000
+
+# basket.length only changes when an admin adds an allocation, so NAV runs share one cached read
+BASKET_LENGTH_CACHE_KEY = "onchain:basket_length"
+# Non-zero currentPositionKey of each allocation; the listener drops it on PositionOpened/PositionClosed
+POSITION_KEYS_CACHE_KEY = "onchain:position_keys"
+# Only invalidated from mined events in the listener; dropping them at send time let a NAV run re-cache stale state
+BASKET_CACHE_KEYS = (BASKET_LENGTH_CACHE_KEY, POSITION_KEYS_CACHE_KEY)
+
+# Receipt polling: web3's default 0.1s poll fires ~10 eth_getTransactionReceipt calls a second
+RECEIPT_TIMEOUT_SECONDS = 300
+# First poll soon after broadcast, then back off geometrically up to the cap
+RECEIPT_POLL_START_SECONDS = 0.5
+RECEIPT_POLL_FACTOR = 1.5
+RECEIPT_POLL_MAX_SECONDS = 5.0
+# EIP-1559 fee params are reused for this long across writes instead of re-fetched per transaction
+TX_FEE_CACHE_SECONDS = 10
+# Upper bound on holding the hot-wallet nonce lock (nonce read through broadcast) and on waiting for it
+NONCE_LOCK_TIMEOUT_SECONDS = 60
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Process-wide keep-alive session for JSON-RPC over HTTP, sized for concurrent workers."""
+    session = requests.Session()
+    # Retries cover connection failures only; POSTs are never re-sent after reaching the node
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=3, backoff_factor=0.1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+@lru_cache(maxsize=1)
+def get_w3() -> Web3:
+    """Process-wide sync Web3 on the pooled session; services share it rather than opening a provider each."""
+    return Web3(Web3.HTTPProvider(settings.NODE_RPC_URL, session=_http_session(), request_kwargs={'timeout': 30}))
+
+def _wallet_lock(address: str):
+    """
+    Cross-process lock around nonce assignment for `address`: the listener, web and worker
+    processes all send from the same hot wallet. No-op where the cache backend has no locks (development).
+    """
+    if not hasattr(cache, 'lock'):
+        return nullcontext()
+    # Not thread-local: the async services acquire and release it from different worker threads
+    return cache.lock(
+        f"onchain:nonce_lock:{address}",
+        timeout=NONCE_LOCK_TIMEOUT_SECONDS,
+        blocking_timeout=NONCE_LOCK_TIMEOUT_SECONDS,
+        thread_local=False,
+    )
+
+@asynccontextmanager
+async def _async_wallet_lock(address: str):
+    """Async form of _wallet_lock; the blocking Redis acquire and release run in a worker thread."""
+    lock = _wallet_lock(address)
+    await asyncio.to_thread(lock.__enter__)
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(lock.__exit__, None, None, None)
+
+# JSON-RPC "invalid request" / "method not found", as returned by nodes that don't accept batches
+BATCH_REJECTION_CODES = (-32600, -32601)
+
+def _is_batch_rejection(exc: Exception) -> bool:
+    """True when the node refused the JSON-RPC batch itself, rather than a call inside it failing."""
+    # web3 attaches the JSON-RPC response to Web3RPCError; older errors carry the error dict as their argument
+    error = (getattr(exc, 'rpc_response', None) or {}).get('error')
+    if error is None and exc.args and isinstance(exc.args[0], dict):
+        error = exc.args[0]
+    if isinstance(error, dict) and error.get('code') in BATCH_REJECTION_CODES:
+        return True
+    message = str(exc).lower()
+    return 'batch' in message or 'method not found' in message
+
+@lru_cache(maxsize=128)
+def _function_codec(contract, fn_name: str) -> tuple[bytes, list[str], list[str]]:
+    """Selector and input/output ABI types of a contract function, resolved once per contract and name."""
+    fn_abi = contract.get_function_by_name(fn_name).abi
+    return function_abi_to_4byte_selector(fn_abi), get_abi_input_types(fn_abi), get_abi_output_types(fn_abi)
+
+def _encode_call(w3: Web3 | AsyncWeb3, contract, fn_name: str, args: list) -> bytes:
+    """Builds calldata from the cached selector and argument types, skipping ContractFunction dispatch."""
+    selector, input_types, _ = _function_codec(contract, fn_name)
+    return selector + w3.codec.encode(input_types, args)
+
+def _decode_return(w3: Web3 | AsyncWeb3, contract, fn_name: str, return_data: bytes):
+    """Decodes raw return data the way ContractFunction.call() would for a single-output function."""
+    decoded = w3.codec.decode(_function_codec(contract, fn_name)[2], return_data)
+    return decoded[0] if len(decoded) == 1 else decoded
+
+def _nav_message_hash(nav_per_token: int, total_value: int, shield_supply: int, timestamp: int) -> bytes:
+    """
+    keccak256(abi.encodePacked(uint256, uint256, uint256, uint256)) as checked by BasketOracle.
+    Packed uint256s are plain 32-byte big-endian words, so no type-list parsing is needed.
+    """
+    return keccak(b''.join(value.to_bytes(32, 'big') for value in (nav_per_token, total_value, shield_supply, timestamp)))
 
 class OnChainService:
     """
     Handles all direct interactions with smart contracts.
     """
-    def __init__(self, w3: Web3 | AsyncWeb3):
-        self.w3 = w3
+    def __init__(self, w3: Web3 | None = None):
+        # Defaults to the shared HTTP client, so views and tasks need not build their own
+        self.w3 = w3 if w3 is not None else get_w3()
         #self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
         # if not self.w3.is_connected():
         #     raise ConnectionError("Web3 provider passed to OnChainService is not connected.")
@@ -38,30 +175,123 @@ class OnChainService:
         log.info("OnChainService initialized", hot_wallet=self.hot_wallet_address)
 
         # --- Load Contracts ---
-        self.vault_manager_contract = self.w3.eth.contract(address=settings.VAULT_MANAGER_CONTRACT_ADDRESS, abi=load_abi("VaultManager"))
-        self.basket_manager_contract = self.w3.eth.contract(address=settings.BASKET_MANAGER_CONTRACT_ADDRESS, abi=load_abi("BasketManager"))
-        self.basket_oracle_contract = self.w3.eth.contract(address=settings.BASKET_ORACLE_CONTRACT_ADDRESS, abi=load_abi("BasketOracle"))
-        self.gmx_reader_contract = self.w3.eth.contract(address=settings.GMX_READER_CONTRACT_ADDRESS, abi=load_abi("GMXReader"))
+        self.vault_manager_contract = self.w3.eth.contract(address=VAULT_MANAGER_ADDRESS, abi=load_abi("VaultManager"))
+        self.basket_manager_contract = self.w3.eth.contract(address=BASKET_MANAGER_ADDRESS, abi=load_abi("BasketManager"))
+        self.basket_oracle_contract = self.w3.eth.contract(address=BASKET_ORACLE_ADDRESS, abi=load_abi("BasketOracle"))
+        self.gmx_reader_contract = self.w3.eth.contract(address=GMX_READER_ADDRESS, abi=load_abi("GMXReader"))
+
+        # Nonces are read from chain on every send, under this lock and the cross-process wallet lock
+        self._nonce_lock = threading.Lock()
+        # Cleared the first time the node rejects a JSON-RPC batch
+        self._batch_supported = True
+        # chainId never changes; fee params are refreshed every TX_FEE_CACHE_SECONDS
+        self._chain_id = None
+        self._fees = None
+        self._fees_fetched_at = 0.0
+
+    def _build_tx(self, contract, fn_name: str, args: list, value: int = 0) -> dict:
+        """
+        Assembles a write transaction from cached calldata encoding, chain id and fee params.
+        build_transaction re-fetches chainId and fees on every call; a gas limit pinned in
+        TX_GAS_LIMITS is used as-is, otherwise gas is estimated once at submission.
+        """
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        tx = {
+            'chainId': self._chain_id,
+            'from': self.hot_wallet_address,
+            'to': contract.address,
+            'data': Web3.to_hex(_encode_call(self.w3, contract, fn_name, args)),
+            'value': value,
+            **self._fee_params(),
+        }
+        if fn_name in settings.TX_GAS_LIMITS:
+            tx['gas'] = settings.TX_GAS_LIMITS[fn_name]
+        return tx
+
+    def _fee_params(self) -> dict:
+        """EIP-1559 fee fields, refreshed at most every TX_FEE_CACHE_SECONDS."""
+        now = time.monotonic()
+        if self._fees is None or now - self._fees_fetched_at > TX_FEE_CACHE_SECONDS:
+            priority_fee = self.w3.eth.max_priority_fee
+            latest_block = self.w3.eth.get_block('latest')
+            # Same headroom as web3's default fee strategy: still valid if the base fee doubles
+            self._fees = {
+                'maxPriorityFeePerGas': priority_fee,
+                'maxFeePerGas': 2 * latest_block['baseFeePerGas'] + priority_fee,
+            }
+            self._fees_fetched_at = now
+        return self._fees
+
+    def _pending_nonce(self, built_tx: dict) -> tuple[int, dict]:
+        """
+        Reads the wallet's nonce from chain ('pending' counts in-flight transactions from every process).
+        When the tx still needs a gas estimate, both requests share one JSON-RPC batch and the
+        returned tx has gas filled in. Must be called under the nonce locks.
+        """
+        if 'gas' not in built_tx and self._batch_supported:
+            try:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_transaction_count(self.hot_wallet_address, 'pending'))
+                    batch.add(self.w3.eth.estimate_gas(built_tx))
+                    nonce, gas = batch.execute()
+                return nonce, {**built_tx, 'gas': gas}
+            except ContractLogicError:
+                raise
+            except Exception as e:
+                # Anything but a refused batch (timeouts, node errors) is the caller's to handle
+                if not _is_batch_rejection(e):
+                    raise
+                log.warning("JSON-RPC batch rejected; falling back to single calls.", error=str(e))
+                self._batch_supported = False
+        return self.w3.eth.get_transaction_count(self.hot_wallet_address, 'pending'), built_tx
+
+    def _submit_transaction(self, built_tx: dict) -> str:
+        """Signs and broadcasts a transaction, returning its hash without waiting for inclusion."""
+        # The wallet lock is held until broadcast so the next sender's 'pending' count includes this tx
+        with self._nonce_lock, _wallet_lock(self.hot_wallet_address):
+            nonce, built_tx = self._pending_nonce(built_tx)
+            tx_with_nonce = {**built_tx, 'nonce': nonce}
+            try:
+                # Gas is only present when pinned in TX_GAS_LIMITS
+                if 'gas' not in tx_with_nonce:
+                    tx_with_nonce['gas'] = self.w3.eth.estimate_gas(tx_with_nonce)
+
+                signed_tx = self.account.sign_transaction(tx_with_nonce)
+                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception:
+                # The cached fees may be too low (e.g. "underpriced"); refetch them for the next send
+                self._fees = None
+                raise
+
+        log.info("Transaction sent.", tx_hash=tx_hash.hex())
+        return tx_hash.hex()
+
+    def _await_receipt(self, tx_hash: str):
+        """Polls for the receipt with exponential backoff until mined; raises if it reverted or timed out."""
+        deadline = time.monotonic() + RECEIPT_TIMEOUT_SECONDS
+        delay = RECEIPT_POLL_START_SECONDS
+        while True:
+            try:
+                receipt = self.w3.eth.get_transaction_receipt(HexBytes(tx_hash))
+                break
+            except TransactionNotFound:
+                if time.monotonic() + delay > deadline:
+                    raise TimeExhausted(f"Transaction {tx_hash} is not in the chain after {RECEIPT_TIMEOUT_SECONDS} seconds")
+                time.sleep(delay)
+                delay = min(delay * RECEIPT_POLL_FACTOR, RECEIPT_POLL_MAX_SECONDS)
+        if receipt.status != 1:
+            log.error("Transaction failed!", tx_hash=tx_hash, receipt=receipt)
+            raise Exception(f"Transaction failed: {tx_hash}")
+
+        log.info("Transaction confirmed.", tx_hash=tx_hash)
+        return receipt
 
     def _send_transaction(self, built_tx: dict) -> str:
         """Signs and sends a transaction, then waits for the receipt."""
-        nonce = self.w3.eth.get_transaction_count(self.hot_wallet_address)
-        tx_with_nonce = {**built_tx, 'nonce': nonce}
-        
-        tx_with_nonce['gas'] = self.w3.eth.estimate_gas(tx_with_nonce)
-        
-        signed_tx = self.account.sign_transaction(tx_with_nonce)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        log.info("Transaction sent, waiting for receipt...", tx_hash=tx_hash.hex())
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        
-        if receipt.status != 1:
-            log.error("Transaction failed!", tx_hash=tx_hash.hex(), receipt=receipt)
-            raise Exception(f"Transaction failed: {tx_hash.hex()}")
-            
-        log.info("Transaction confirmed.", tx_hash=tx_hash.hex())
-        return tx_hash.hex()
+        tx_hash = self._submit_transaction(built_tx)
+        self._await_receipt(tx_hash)
+        return tx_hash
 
     def get_intent_id_from_deposit(self, deposit_id: int) -> str | None:
         """Reads the associated intentId from a pending deposit."""
@@ -95,34 +325,35 @@ class OnChainService:
             return 0
 
 
-    def execute_mint_intent(self, intent_id: str) -> str:
+    def execute_mint_intent(self, intent_id: bytes | str) -> str:
         log.info("Building transaction to execute mint intent.", intent_id=intent_id)
-        intent_id_bytes = bytes.fromhex(intent_id[2:])
-        tx = self.vault_manager_contract.functions.executeMintIntent(intent_id_bytes).build_transaction({'from': self.hot_wallet_address})
+        # HexBytes accepts raw bytes or hex with or without the 0x prefix
+        intent_id_bytes = HexBytes(intent_id)
+        tx = self._build_tx(self.vault_manager_contract, 'executeMintIntent', [intent_id_bytes])
         return self._send_transaction(tx)
 
-    def execute_redeem_intent(self, intent_id: str) -> str:
+    def execute_redeem_intent(self, intent_id: bytes | str) -> str:
         log.info("Building transaction to execute redeem intent.", intent_id=intent_id)
-        intent_id_bytes = bytes.fromhex(intent_id[2:])
-        tx = self.basket_manager_contract.functions.executeRedeemIntent(intent_id_bytes).build_transaction({'from': self.hot_wallet_address})
+        # HexBytes accepts raw bytes or hex with or without the 0x prefix
+        intent_id_bytes = HexBytes(intent_id)
+        tx = self._build_tx(self.basket_manager_contract, 'executeRedeemIntent', [intent_id_bytes])
         return self._send_transaction(tx)
 
-    def update_basket_weight(self, basket_index: int, new_weight_bps: int) -> str:
+    def update_basket_weight(self, basket_index: int, new_weight_bps: int, wait: bool = True) -> str:
         """Calls the Basket Manager contract to update a basket weight."""
         log.info("Building transaction to update basket weight.", basket_index=basket_index, new_weight_bps=new_weight_bps)
-        tx = self.basket_manager_contract.functions.updateBasketWeight(basket_index, new_weight_bps).build_transaction({
-            'from': self.hot_wallet_address,
-        })
-        return self._send_transaction(tx)
+        tx = self._build_tx(self.basket_manager_contract, 'updateBasketWeight', [basket_index, new_weight_bps])
+        # With wait=False the hash is returned as soon as the node accepts the tx; the listener sees the result
+        tx_hash = self._send_transaction(tx) if wait else self._submit_transaction(tx)
+        return tx_hash
 
-    def rebalance_positions(self) -> str:
+    def rebalance_positions(self, wait: bool = True) -> str:
         log.info("Building transaction to rebalance positions.")
         fee_in_wei = self.w3.to_wei(settings.REBALANCE_EXECUTION_FEE_ETH, 'ether')
-        tx = self.basket_manager_contract.functions.rebalancePositions().build_transaction({
-            'from': self.hot_wallet_address,
-            'value': fee_in_wei
-        })
-        return self._send_transaction(tx)
+        tx = self._build_tx(self.basket_manager_contract, 'rebalancePositions', [], value=fee_in_wei)
+        # With wait=False the hash is returned as soon as the node accepts the tx; the listener sees the result
+        tx_hash = self._send_transaction(tx) if wait else self._submit_transaction(tx)
+        return tx_hash
 
     def submit_nav(self, nav_data: dict) -> str:
         """Signs NAV data and submits it to the BasketOracle."""
@@ -135,21 +366,18 @@ class OnChainService:
         timestamp = nav_data['timestamp']
 
         # EIP-712 style packing might be safer, but using keccak256 as specified
-        message_hash = self.w3.solidity_keccak(
-            ['uint256', 'uint256', 'uint256', 'uint256'],
-            [nav_per_token, total_value, shield_supply, timestamp]
-        )
+        message_hash = _nav_message_hash(nav_per_token, total_value, shield_supply, timestamp)
         
         # Sign the hash (EIP-191)
-        signed_message = self.account.sign_message(encode_defunct(hexstr=message_hash.hex()))
+        signed_message = self.account.sign_message(encode_defunct(primitive=message_hash))
         signature = signed_message.signature
 
-        tx = self.basket_oracle_contract.functions.submitNAV(
+        tx = self._build_tx(self.basket_oracle_contract, 'submitNAV', [
             nav_per_token,
             total_value,
             shield_supply,
             signature
-        ).build_transaction({'from': self.hot_wallet_address})
+        ])
         
         return self._send_transaction(tx)
     
@@ -161,6 +389,14 @@ class OnChainService:
             log.error("Failed to get basket allocation", index=index, error=e)
             raise # Re-raise the exception to be handled by the caller
 
+@lru_cache(maxsize=1)
+def get_onchain_service() -> OnChainService:
+    """
+    Process-wide OnChainService for views and tasks. Reusing it keeps the contracts and the
+    cached chain id and fees instead of rebuilding them per call.
+    """
+    return OnChainService()
+
 class AsyncOnChainService:
     """
     Handles all direct interactions with smart contracts.
@@ -173,50 +409,209 @@ class AsyncOnChainService:
         log.info("OnChainService initialized", hot_wallet=self.hot_wallet_address)
 
         # --- Load Contracts ---
-        self.vault_manager_contract = self.w3.eth.contract(address=settings.VAULT_MANAGER_CONTRACT_ADDRESS, abi=load_abi("VaultManager"))
-        self.basket_manager_contract = self.w3.eth.contract(address=settings.BASKET_MANAGER_CONTRACT_ADDRESS, abi=load_abi("BasketManager"))
-        self.basket_oracle_contract = self.w3.eth.contract(address=settings.BASKET_ORACLE_CONTRACT_ADDRESS, abi=load_abi("BasketOracle"))
-        self.gmx_reader_contract = self.w3.eth.contract(address=settings.GMX_READER_CONTRACT_ADDRESS, abi=load_abi("GMXReader"))
+        self.vault_manager_contract = self.w3.eth.contract(address=VAULT_MANAGER_ADDRESS, abi=load_abi("VaultManager"))
+        self.basket_manager_contract = self.w3.eth.contract(address=BASKET_MANAGER_ADDRESS, abi=load_abi("BasketManager"))
+        self.basket_oracle_contract = self.w3.eth.contract(address=BASKET_ORACLE_ADDRESS, abi=load_abi("BasketOracle"))
+        self.gmx_reader_contract = self.w3.eth.contract(address=GMX_READER_ADDRESS, abi=load_abi("GMXReader"))
+        self.multicall_contract = (
+            self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=load_abi("Multicall3")) if MULTICALL3_ADDRESS else None
+        )
+        self.nav_aggregator_contract = (
+            self.w3.eth.contract(address=NAV_AGGREGATOR_ADDRESS, abi=load_abi("NavAggregator")) if NAV_AGGREGATOR_ADDRESS else None
+        )
+
+        # An order's intentId never changes once set on-chain, so replays skip the eth_call
+        self._deposit_intent_ids = OrderedDict()
+        self._withdrawal_intent_ids = OrderedDict()
+        # Serialises nonce assignment when the listener executes several intents concurrently;
+        # nonces are read from chain on every send, under this lock and the cross-process wallet lock
+        self._send_lock = asyncio.Lock()
+        # Cleared the first time the node rejects a JSON-RPC batch
+        self._batch_supported = True
+        # chainId never changes; fee params are refreshed every TX_FEE_CACHE_SECONDS
+        self._chain_id = None
+        self._fees = None
+        self._fees_fetched_at = 0.0
+
+    async def aggregate(self, calls: list[tuple], allow_failure: bool = False) -> list:
+        """
+        Runs several read calls in a single Multicall3 eth_call, so they all see the same block.
+        `calls` holds (contract, function name, args) tuples; results come back in order, with
+        None for calls that reverted when allow_failure is set.
+        """
+        if self.multicall_contract is None:
+            if self._batch_supported:
+                try:
+                    async with self.w3.batch_requests() as batch:
+                        for contract, fn_name, args in calls:
+                            batch.add(getattr(contract.functions, fn_name)(*args))
+                        return await batch.async_execute()
+                except ContractLogicError:
+                    # A reverting call fails the whole batch; retry singly so allow_failure is honoured
+                    pass
+                except Exception as e:
+                    # Some public endpoints reject JSON-RPC batches; stop trying them for this instance
+                    if not _is_batch_rejection(e):
+                        raise
+                    log.warning("JSON-RPC batch rejected; using concurrent single calls.", error=str(e))
+                    self._batch_supported = False
+            # Bounded fan-out of individual eth_calls
+            semaphore = asyncio.Semaphore(settings.RPC_CONCURRENCY)
+
+            async def bounded_call(contract, fn_name, args):
+                async with semaphore:
+                    return await self._call(contract, fn_name, args, allow_failure=allow_failure)
+
+            return await asyncio.gather(*(bounded_call(*call) for call in calls))
+
+        results = await self.multicall_contract.functions.aggregate3([
+            (contract.address, allow_failure, _encode_call(self.w3, contract, fn_name, args))
+            for contract, fn_name, args in calls
+        ]).call()
+        return [
+            _decode_return(self.w3, contract, fn_name, return_data) if success else None
+            for (contract, fn_name, _), (success, return_data) in zip(calls, results)
+        ]
+
+    async def _call(self, contract, fn_name: str, args: list, allow_failure: bool = False):
+        """Single eth_call used when neither Multicall3 nor JSON-RPC batching is available."""
+        try:
+            return await getattr(contract.functions, fn_name)(*args).call()
+        except Exception:
+            if not allow_failure:
+                raise
+            return None
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: int, value: str):
+        cache[key] = value
+        if len(cache) > INTENT_ID_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    async def _build_tx(self, contract, fn_name: str, args: list, value: int = 0) -> dict:
+        """Async counterpart of OnChainService._build_tx."""
+        if self._chain_id is None:
+            self._chain_id = await self.w3.eth.chain_id
+        tx = {
+            'chainId': self._chain_id,
+            'from': self.hot_wallet_address,
+            'to': contract.address,
+            'data': Web3.to_hex(_encode_call(self.w3, contract, fn_name, args)),
+            'value': value,
+            **(await self._fee_params()),
+        }
+        if fn_name in settings.TX_GAS_LIMITS:
+            tx['gas'] = settings.TX_GAS_LIMITS[fn_name]
+        return tx
+
+    async def _fee_params(self) -> dict:
+        """EIP-1559 fee fields, refreshed at most every TX_FEE_CACHE_SECONDS."""
+        now = time.monotonic()
+        if self._fees is None or now - self._fees_fetched_at > TX_FEE_CACHE_SECONDS:
+            priority_fee = await self.w3.eth.max_priority_fee
+            latest_block = await self.w3.eth.get_block('latest')
+            # Same headroom as web3's default fee strategy: still valid if the base fee doubles
+            self._fees = {
+                'maxPriorityFeePerGas': priority_fee,
+                'maxFeePerGas': 2 * latest_block['baseFeePerGas'] + priority_fee,
+            }
+            self._fees_fetched_at = now
+        return self._fees
+
+    async def _pending_nonce(self, built_tx: dict) -> tuple[int, dict]:
+        """Async counterpart of OnChainService._pending_nonce."""
+        if 'gas' not in built_tx and self._batch_supported:
+            try:
+                async with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_transaction_count(self.hot_wallet_address, 'pending'))
+                    batch.add(self.w3.eth.estimate_gas(built_tx))
+                    nonce, gas = await batch.async_execute()
+                return nonce, {**built_tx, 'gas': gas}
+            except ContractLogicError:
+                raise
+            except Exception as e:
+                # Anything but a refused batch (timeouts, node errors) is the caller's to handle
+                if not _is_batch_rejection(e):
+                    raise
+                log.warning("JSON-RPC batch rejected; falling back to single calls.", error=str(e))
+                self._batch_supported = False
+        return await self.w3.eth.get_transaction_count(self.hot_wallet_address, 'pending'), built_tx
+
+    async def _submit_transaction(self, built_tx: dict) -> str:
+        """Signs and broadcasts a transaction, returning its hash without waiting for inclusion."""
+        async with self._send_lock, _async_wallet_lock(self.hot_wallet_address):
+            nonce, built_tx = await self._pending_nonce(built_tx)
+            tx_with_nonce = {**built_tx, 'nonce': nonce}
+            try:
+                # Gas is only present when pinned in TX_GAS_LIMITS
+                if 'gas' not in tx_with_nonce:
+                    tx_with_nonce['gas'] = await self.w3.eth.estimate_gas(tx_with_nonce)
+
+                signed_tx = self.account.sign_transaction(tx_with_nonce)
+                tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception:
+                # The cached fees may be too low (e.g. "underpriced"); refetch them for the next send
+                self._fees = None
+                raise
+
+        log.info("Transaction sent.", tx_hash=tx_hash.hex())
+        return tx_hash.hex()
+
+    async def _await_receipt(self, tx_hash: str):
+        """Polls for the receipt with exponential backoff until mined; raises if it reverted or timed out."""
+        deadline = time.monotonic() + RECEIPT_TIMEOUT_SECONDS
+        delay = RECEIPT_POLL_START_SECONDS
+        while True:
+            try:
+                receipt = await self.w3.eth.get_transaction_receipt(HexBytes(tx_hash))
+                break
+            except TransactionNotFound:
+                if time.monotonic() + delay > deadline:
+                    raise TimeExhausted(f"Transaction {tx_hash} is not in the chain after {RECEIPT_TIMEOUT_SECONDS} seconds")
+                await asyncio.sleep(delay)
+                delay = min(delay * RECEIPT_POLL_FACTOR, RECEIPT_POLL_MAX_SECONDS)
+        if receipt.status != 1:
+            log.error("Transaction failed!", tx_hash=tx_hash, receipt=receipt)
+            raise Exception(f"Transaction failed: {tx_hash}")
+
+        log.info("Transaction confirmed.", tx_hash=tx_hash)
+        return receipt
 
     async def _send_transaction(self, built_tx: dict) -> str:
         """Signs and sends a transaction, then waits for the receipt."""
-        nonce = await self.w3.eth.get_transaction_count(self.hot_wallet_address)
-        tx_with_nonce = {**built_tx, 'nonce': nonce}
-        
-        tx_with_nonce['gas'] = await self.w3.eth.estimate_gas(tx_with_nonce)
-        
-        signed_tx = await self.account.sign_transaction(tx_with_nonce)
-        tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        
-        log.info("Transaction sent, waiting for receipt...", tx_hash=tx_hash.hex())
-        receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        
-        if receipt.status != 1:
-            log.error("Transaction failed!", tx_hash=tx_hash.hex(), receipt=receipt)
-            raise Exception(f"Transaction failed: {tx_hash.hex()}")
-            
-        log.info("Transaction confirmed.", tx_hash=tx_hash.hex())
-        return tx_hash.hex()
+        tx_hash = await self._submit_transaction(built_tx)
+        await self._await_receipt(tx_hash)
+        return tx_hash
 
     async def get_intent_id_from_deposit(self, deposit_id: int) -> str | None:
         """Reads the associated intentId from a pending deposit."""
+        if deposit_id in self._deposit_intent_ids:
+            self._deposit_intent_ids.move_to_end(deposit_id)
+            return self._deposit_intent_ids[deposit_id]
         try:
             deposit_data = await self.basket_manager_contract.functions.pendingDeposits(deposit_id).call()
             # associatedOrders should contain the intentId
             associated_orders = deposit_data[3]
             if associated_orders:
-                return associated_orders[0].hex() # Return the first associated order as hex
+                intent_id = associated_orders[0].hex() # Return the first associated order as hex
+                self._remember(self._deposit_intent_ids, deposit_id, intent_id)
+                return intent_id
         except Exception as e:
             log.error("Failed to read pendingDeposits", deposit_id=deposit_id, error=e)
         return None
 
     async def get_intent_id_from_withdrawal(self, withdrawal_id: int) -> str | None:
         """Reads the associated intentId from a pending withdrawal."""
+        if withdrawal_id in self._withdrawal_intent_ids:
+            self._withdrawal_intent_ids.move_to_end(withdrawal_id)
+            return self._withdrawal_intent_ids[withdrawal_id]
         try:
             withdrawal_data = await self.basket_manager_contract.functions.pendingWithdrawals(withdrawal_id).call()
             associated_orders = withdrawal_data[3]
             if associated_orders:
-                return associated_orders[0].hex()
+                intent_id = associated_orders[0].hex()
+                self._remember(self._withdrawal_intent_ids, withdrawal_id, intent_id)
+                return intent_id
         except Exception as e:
             log.error("Failed to read pendingWithdrawals", withdrawal_id=withdrawal_id, error=e)
         return None
@@ -230,34 +625,45 @@ class AsyncOnChainService:
             return 0
 
 
-    async def execute_mint_intent(self, intent_id: str) -> str:
+    async def execute_mint_intent(self, intent_id: bytes | str) -> str:
         log.info("Building transaction to execute mint intent.", intent_id=intent_id)
-        intent_id_bytes = bytes.fromhex(intent_id[2:])
-        tx = await self.vault_manager_contract.functions.executeMintIntent(intent_id_bytes).build_transaction({'from': self.hot_wallet_address})
+        # HexBytes accepts raw bytes or hex with or without the 0x prefix
+        intent_id_bytes = HexBytes(intent_id)
+        tx = await self._build_tx(self.vault_manager_contract, 'executeMintIntent', [intent_id_bytes])
         return await self._send_transaction(tx)
 
-    async def execute_redeem_intent(self, intent_id: str) -> str:
+    async def execute_redeem_intent(self, intent_id: bytes | str) -> str:
         log.info("Building transaction to execute redeem intent.", intent_id=intent_id)
-        intent_id_bytes = bytes.fromhex(intent_id[2:])
-        tx = await self.basket_manager_contract.functions.executeRedeemIntent(intent_id_bytes).build_transaction({'from': self.hot_wallet_address})
+        # HexBytes accepts raw bytes or hex with or without the 0x prefix
+        intent_id_bytes = HexBytes(intent_id)
+        tx = await self._build_tx(self.basket_manager_contract, 'executeRedeemIntent', [intent_id_bytes])
         return await self._send_transaction(tx)
 
-    async def update_basket_weight(self, basket_index: int, new_weight_bps: int) -> str:
+    async def get_intent_status(self, getter: str, intent_id: bytes | str) -> tuple[OnChainIntentStatus, int] | None:
+        """
+        Reads an intent's on-chain status and expiresAt through VaultManager's mintIntents or
+        redeemIntents getter. Returns None when no such intent exists.
+        """
+        intent = await getattr(self.vault_manager_contract.functions, getter)(HexBytes(intent_id)).call()
+        if intent[1] == ZERO_ADDRESS:
+            return None
+        return OnChainIntentStatus(intent[INTENT_STATUS_INDEX]), intent[INTENT_EXPIRES_AT_INDEX]
+
+    async def update_basket_weight(self, basket_index: int, new_weight_bps: int, wait: bool = True) -> str:
         """Calls the Basket Manager contract to update a basket weight."""
         log.info("Building transaction to update basket weight.", basket_index=basket_index, new_weight_bps=new_weight_bps)
-        tx = await self.basket_manager_contract.functions.updateBasketWeight(basket_index, new_weight_bps).build_transaction({
-            'from': self.hot_wallet_address,
-        })
-        return await self._send_transaction(tx)
+        tx = await self._build_tx(self.basket_manager_contract, 'updateBasketWeight', [basket_index, new_weight_bps])
+        # With wait=False the hash is returned as soon as the node accepts the tx; the listener sees the result
+        tx_hash = await self._send_transaction(tx) if wait else await self._submit_transaction(tx)
+        return tx_hash
 
-    async def rebalance_positions(self) -> str:
+    async def rebalance_positions(self, wait: bool = True) -> str:
         log.info("Building transaction to rebalance positions.")
-        fee_in_wei = await self.w3.to_wei(settings.REBALANCE_EXECUTION_FEE_ETH, 'ether')
-        tx = await self.basket_manager_contract.functions.rebalancePositions().build_transaction({
-            'from': self.hot_wallet_address,
-            'value': fee_in_wei
-        })
-        return await self._send_transaction(tx)
+        fee_in_wei = self.w3.to_wei(settings.REBALANCE_EXECUTION_FEE_ETH, 'ether')
+        tx = await self._build_tx(self.basket_manager_contract, 'rebalancePositions', [], value=fee_in_wei)
+        # With wait=False the hash is returned as soon as the node accepts the tx; the listener sees the result
+        tx_hash = await self._send_transaction(tx) if wait else await self._submit_transaction(tx)
+        return tx_hash
 
     async def submit_nav(self, nav_data: dict) -> str:
         """Signs NAV data and submits it to the BasketOracle."""
@@ -270,21 +676,18 @@ class AsyncOnChainService:
         timestamp = nav_data['timestamp']
 
         # EIP-712 style packing might be safer, but using keccak256 as specified
-        message_hash = self.w3.solidity_keccak(
-            ['uint256', 'uint256', 'uint256', 'uint256'],
-            [nav_per_token, total_value, shield_supply, timestamp]
-        )
+        message_hash = _nav_message_hash(nav_per_token, total_value, shield_supply, timestamp)
         
         # Sign the hash (EIP-191)
-        signed_message = await self.account.sign_message(encode_defunct(hexstr=message_hash.hex()))
+        signed_message = self.account.sign_message(encode_defunct(primitive=message_hash))
         signature = signed_message.signature
 
-        tx = await self.basket_oracle_contract.functions.submitNAV(
+        tx = await self._build_tx(self.basket_oracle_contract, 'submitNAV', [
             nav_per_token,
             total_value,
             shield_supply,
             signature
-        ).build_transaction({'from': self.hot_wallet_address})
+        ])
         
         return await self._send_transaction(tx)
     
@@ -300,93 +703,184 @@ class AsyncOnChainService:
 class NAVCalculatorService:
     """Service to calculate the total position size (NAV) periodically."""
     def __init__(self):
-        w3_http = Web3(Web3.HTTPProvider(settings.NODE_RPC_URL))
-        self.onchain_service = OnChainService(w3=w3_http)
+        w3_http = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(settings.NODE_RPC_URL, request_kwargs={'timeout': ClientTimeout(total=30)}))
+        self.onchain_service = AsyncOnChainService(w3=w3_http)
 
     def run(self, trigger_source="scheduled"):
-        log.info("Running NAV Calculator Service.", trigger=trigger_source)
-        
+        asyncio.run(self.run_async(trigger_source=trigger_source))
+
+    async def read_position_keys(self) -> list[bytes]:
+        """Returns the open GMX position key of each basket allocation, from cache when warm."""
+        position_keys = await cache.aget(POSITION_KEYS_CACHE_KEY)
+        if position_keys is not None:
+            return position_keys
+
+        basket_manager = self.onchain_service.basket_manager_contract
+        basket_length = await cache.aget(BASKET_LENGTH_CACHE_KEY)
+        if basket_length is None:
+            basket_length = await basket_manager.functions.getBasketLength().call()
+            await cache.aset(BASKET_LENGTH_CACHE_KEY, basket_length, timeout=settings.BASKET_LENGTH_CACHE_SECONDS)
+        # One aggregated eth_call for every allocation instead of one per index
+        allocations = await self.onchain_service.aggregate([
+            (basket_manager, 'getBasketAllocation', [i]) for i in range(basket_length)
+        ])
+
+        # Keys stay as the raw bytes32 the ABI decoder returned; they are passed straight back to getPosition
+        position_keys = [
+            alloc[5] for alloc in allocations
+            # Skip the zero bytes32 value (no position opened yet)
+            if isinstance(alloc[5], bytes) and any(alloc[5])
+        ]
+        await cache.aset(POSITION_KEYS_CACHE_KEY, position_keys, timeout=settings.POSITION_KEYS_CACHE_SECONDS)
+        return position_keys
+
+    async def read_gmx_value(self) -> int:
+        """Sums the collateral of every GMX position referenced by the basket, in 30-decimal USD."""
         # 1. Get position keys from BasketManager
-        basket_length = self.onchain_service.basket_manager_contract.functions.getBasketLength().call()
-        position_keys = []
-        for i in range(basket_length):
-            alloc = self.onchain_service.basket_manager_contract.functions.getBasketAllocation(i).call()
-            pos_key_raw = alloc[5]
-            if isinstance(pos_key_raw, bytes):
-                pos_key_hex = pos_key_raw.hex()
-                # Check if the key is not the zero bytes32 value
-                if int(pos_key_hex, 16) != 0:
-                    position_keys.append("0x" + pos_key_hex)
+        position_keys = await self.read_position_keys()
 
         # 2. Get real position values from GMX
-        total_gmx_value = Decimal(0)
-        for key_hex in position_keys:
-            key_bytes = bytes.fromhex(key_hex[2:])
+        gmx_reader = self.onchain_service.gmx_reader_contract
+        aggregator = self.onchain_service.nav_aggregator_contract
+        if aggregator is not None and position_keys:
             try:
-                # --- NEW: Using the correct function and parsing the result ---
-                # The result is a nested tuple: ((addresses), (numbers), (flags))
-                # We need numbers -> collateralAmount, which is pos_data[1][2]
-                pos_data = self.onchain_service.gmx_reader_contract.functions.getPosition(
-                    settings.GMX_DATA_STORE_ADDRESS, key_bytes
+                # The sum is computed on-chain, so one uint256 comes back instead of a struct per position
+                total_gmx_value, failed = await aggregator.functions.sumCollateral(
+                    gmx_reader.address, GMX_DATA_STORE_ADDRESS, position_keys
                 ).call()
-                
-                # According to your docs, you need `collateralUsd`. Based on GMX V2 contracts,
-                # this usually corresponds to `collateralAmount`. Let's assume it's the 3rd item in the numbers struct (index 2).
-                collateral_amount_gmx = pos_data[1][2] # numbers.collateralAmount
-                
-                # GMX V2 uses 30 decimals for USD values. Convert to 18.
-                collateral_usd_18_decimals = Decimal(collateral_amount_gmx) / GMX_SCALAR
-                total_gmx_value += collateral_usd_18_decimals
-                log.info("Processed GMX position.", key=key_hex, collateral_usd=collateral_usd_18_decimals)
-                # --- END NEW ---
+                if failed:
+                    log.error("Failed to get position data from GMX Reader.", failed_positions=failed)
+                log.info("Summed GMX positions via NavAggregator.", positions=len(position_keys), collateral_usd_30_decimals=total_gmx_value)
+                return total_gmx_value
             except Exception as e:
-                log.error("Failed to get position data from GMX Reader.", key=key_hex, error=e, exc_info=True)
+                log.warning("NavAggregator read failed; falling back to per-position reads.", error=str(e))
+
+        total_gmx_value = 0
+        try:
+            # Likewise, all positions are read in a single call; a reverting position does not fail the rest
+            positions = await self.onchain_service.aggregate([
+                (gmx_reader, 'getPosition', [GMX_DATA_STORE_ADDRESS, key])
+                for key in position_keys
+            ], allow_failure=True)
+        except Exception as e:
+            log.error("Failed to get position data from GMX Reader.", keys=[key.hex() for key in position_keys], error=e, exc_info=True)
+            positions = [None] * len(position_keys)
+
+        for key, pos_data in zip(position_keys, positions):
+            if pos_data is None:
+                log.error("Failed to get position data from GMX Reader.", key=key.hex())
                 # Decide if you want to stop the NAV calculation or continue with a partial value
                 # For now, we'll just log and continue.
+                continue
 
-        # 3. Get idle reserves from BasketManager
-        stable_config = self.onchain_service.basket_manager_contract.functions.stablecoins(settings.USDC_ADDRESS).call()
-        reserves_usdc = stable_config[3] # reserves
-        idle_reserves_usd = Decimal(reserves_usdc) * USDC_SCALAR
+            # The result is a nested tuple: ((addresses), (numbers), (flags))
+            # According to your docs, you need `collateralUsd`. Based on GMX V2 contracts,
+            # this usually corresponds to `collateralAmount`. Let's assume it's the 3rd item in the numbers struct (index 2).
+            collateral_amount_gmx = pos_data[1][2] # numbers.collateralAmount
+
+            # GMX V2 uses 30 decimals for USD values; kept as-is and scaled once at the end
+            total_gmx_value += collateral_amount_gmx
+            log.info("Processed GMX position.", key=key.hex(), collateral_usd_30_decimals=collateral_amount_gmx)
+        return total_gmx_value
+
+    async def run_async(self, trigger_source="scheduled"):
+        log.info("Running NAV Calculator Service.", trigger=trigger_source)
 
-        # 4. Get SHIELD supply
-        shield_supply_wei = self.onchain_service.basket_manager_contract.functions.totalSupply().call()
+        # 1-2. GMX position values and 3-4. idle reserves + SHIELD supply are independent reads,
+        # so they are in flight together rather than one after another. Reserves and supply share
+        # one Multicall3 eth_call, so both come from the same block.
+        basket_manager = self.onchain_service.basket_manager_contract
+        total_gmx_value, (stable_config, shield_supply_wei) = await asyncio.gather(
+            self.read_gmx_value(),
+            self.onchain_service.aggregate([
+                (basket_manager, 'stablecoins', [USDC_ADDRESS]),
+                (basket_manager, 'totalSupply', []),
+            ]),
+        )
+        reserves_usdc = stable_config[3] # reserves
+        idle_reserves_usd = reserves_usdc * USDC_TO_GMX_MUL
         
-        # 5. Calculate NAV
+        # 5. Calculate NAV (all 30-decimal ints; only the log line and DB row use Decimal)
         total_managed_value = total_gmx_value + idle_reserves_usd
         if shield_supply_wei == 0:
-            nav_per_token_wei = int(WEI_SCALAR)
+            nav_per_token_wei = WEI
         else:
             # Formula: (total_value_18_decimals * 1e18) / shield_supply_18_decimals
-            nav_per_token_wei = int((total_managed_value * WEI_SCALAR) / Decimal(shield_supply_wei))
+            nav_per_token_wei = total_managed_value * WEI // GMX_TO_TARGET_DIV // shield_supply_wei
 
         log.info(
             "NAV calculation complete.",
-            total_gmx_value=f"{total_gmx_value:.4f}",
-            idle_reserves=f"{idle_reserves_usd / WEI_SCALAR:.4f}",
-            total_managed_value=f"{total_managed_value / WEI_SCALAR:.4f}",
-            shield_supply=f"{Decimal(shield_supply_wei)/WEI_SCALAR:.4f}",
-            nav_per_token=f"{Decimal(nav_per_token_wei)/WEI_SCALAR:.6f}",
+            total_gmx_value=f"{from_base_units(total_gmx_value, GMX_DECIMALS - TARGET_DECIMALS):.4f}",
+            idle_reserves=f"{from_base_units(idle_reserves_usd, GMX_DECIMALS):.4f}",
+            total_managed_value=f"{from_base_units(total_managed_value, GMX_DECIMALS):.4f}",
+            shield_supply=f"{from_base_units(shield_supply_wei, TARGET_DECIMALS):.4f}",
+            nav_per_token=f"{from_base_units(nav_per_token_wei, TARGET_DECIMALS):.6f}",
         )
 
         nav_data = {
             'navPerToken': nav_per_token_wei,
-            'totalManagedValue': int(total_managed_value * WEI_SCALAR),
+            'totalManagedValue': total_managed_value * WEI // GMX_TO_TARGET_DIV,
             'shieldSupply': shield_supply_wei,
             'timestamp': int(time.time()),
         }
 
         # 6. Sign and submit NAV
-        message_hash = self.onchain_service.w3.solidity_keccak(['uint256', 'uint256', 'uint256', 'uint256'], [nav_data['navPerToken'], nav_data['totalManagedValue'], nav_data['shieldSupply'], nav_data['timestamp']])
-        signed_message = self.onchain_service.account.sign_message(encode_defunct(hexstr=message_hash.hex()))
+        message_hash = _nav_message_hash(nav_data['navPerToken'], nav_data['totalManagedValue'], nav_data['shieldSupply'], nav_data['timestamp'])
+        signed_message = self.onchain_service.account.sign_message(encode_defunct(primitive=message_hash))
         signature = signed_message.signature
 
         tx_hash = None
         try:
-            tx = self.onchain_service.basket_oracle_contract.functions.submitNAV(nav_data['navPerToken'], nav_data['totalManagedValue'], nav_data['shieldSupply'], signature).build_transaction({'from': self.onchain_service.hot_wallet_address})
-            tx_hash = self.onchain_service._send_transaction(tx)
+            tx = await self.onchain_service._build_tx(self.onchain_service.basket_oracle_contract, 'submitNAV', [nav_data['navPerToken'], nav_data['totalManagedValue'], nav_data['shieldSupply'], signature])
+            # Fire-and-verify: inclusion is checked later by verify_submissions, not waited on here
+            tx_hash = await self.onchain_service._submit_transaction(tx)
         except Exception as e:
             log.error("Failed to submit NAV on-chain.", error=str(e), exc_info=True)
         
-        NAVUpdateLog.objects.create(total_position_size=total_managed_value, onchain_tx_hash=tx_hash)
-        log.info("NAV Calculator Service finished.", final_tx_hash=tx_hash)
\ No newline at end of file
+        await NAVUpdateLog.objects.acreate(
+            total_position_size=from_base_units(total_managed_value, GMX_DECIMALS - TARGET_DECIMALS),
+            onchain_tx_hash=tx_hash,
+            status=TxStatus.PENDING if tx_hash else TxStatus.FAILED,
+        )
+        log.info("NAV Calculator Service finished.", final_tx_hash=tx_hash)
+
+    def verify_submissions(self):
+        asyncio.run(self.verify_submissions_async())
+
+    async def verify_submissions_async(self):
+        """Resolves PENDING NAV submissions to CONFIRMED or FAILED from their receipts."""
+        # Rows logged before the status column existed were backfilled as PENDING; those without a
+        # tx hash never reached the chain. Migrations are generated at deploy, so this resolves them here.
+        unsent = await NAVUpdateLog.objects.filter(status=TxStatus.PENDING, onchain_tx_hash__isnull=True).aupdate(status=TxStatus.FAILED)
+        if unsent:
+            log.info("Marked NAV updates without a tx hash as FAILED.", count=unsent)
+
+        pending = [
+            entry async for entry in NAVUpdateLog.objects.filter(status=TxStatus.PENDING, onchain_tx_hash__isnull=False)
+            .only('id', 'onchain_tx_hash', 'created_at')
+        ]
+        if not pending:
+            return
+
+        receipts = await asyncio.gather(
+            *(self.onchain_service.w3.eth.get_transaction_receipt(HexBytes(entry.onchain_tx_hash)) for entry in pending),
+            return_exceptions=True,
+        )
+        now = timezone.now()
+        for entry, receipt in zip(pending, receipts):
+            if isinstance(receipt, TransactionNotFound):
+                # Not mined yet; give up once it has been outstanding longer than a blocking wait would have
+                if (now - entry.created_at).total_seconds() < RECEIPT_TIMEOUT_SECONDS:
+                    continue
+                log.error("NAV submission was never mined.", tx_hash=entry.onchain_tx_hash)
+                new_status = TxStatus.FAILED
+            elif isinstance(receipt, Exception):
+                log.warning("Could not fetch NAV submission receipt; will retry.", tx_hash=entry.onchain_tx_hash, error=str(receipt))
+                continue
+            elif receipt.status != 1:
+                log.error("NAV submission reverted.", tx_hash=entry.onchain_tx_hash)
+                new_status = TxStatus.FAILED
+            else:
+                new_status = TxStatus.CONFIRMED
+            await NAVUpdateLog.objects.filter(id=entry.id, status=TxStatus.PENDING).aupdate(status=new_status)
+            log.info("NAV submission verified.", tx_hash=entry.onchain_tx_hash, status=new_status)
\ No newline at end of file
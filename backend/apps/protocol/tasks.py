@@ -3,12 +3,19 @@ from celery import shared_task
 import structlog
 from .services import NAVCalculatorService
 from django.conf import settings
-from .services import OnChainService 
+from django.core.cache import cache
+from .services import get_onchain_service
 
 log = structlog.get_logger(__name__)
 
+NAV_UPDATE_PENDING_KEY = "protocol:nav_update_pending"
+
+# Acked on receipt: the NAV tx is broadcast without waiting for inclusion, so a redelivery after a
+# worker crash could submit a second update; the periodic beat run covers a lost one instead
 @shared_task(name="protocol.update_nav")
 def update_nav_task(trigger_source="scheduled"):
+    # Let triggers arriving from here on queue a fresh run that will see this update's effects
+    cache.delete(NAV_UPDATE_PENDING_KEY)
     log.info("Executing NAV update task.", trigger=trigger_source)
     try:
         service = NAVCalculatorService()
@@ -16,6 +23,14 @@ def update_nav_task(trigger_source="scheduled"):
     except Exception as e:
         log.error("Error during NAV update task.", error=str(e), exc_info=True)
 
+@shared_task(name="protocol.verify_nav_submissions")
+def verify_nav_submissions_task():
+    """Marks submitted NAV updates CONFIRMED or FAILED once their receipts are available."""
+    try:
+        NAVCalculatorService().verify_submissions()
+    except Exception as e:
+        log.error("Error during NAV submission verification.", error=str(e), exc_info=True)
+
 @shared_task(name="protocol.trigger_rebalance")
 def trigger_rebalance_task():
     """Waits for cooldown then triggers rebalancePositions."""
@@ -24,8 +39,19 @@ def trigger_rebalance_task():
     
     log.info("Cooldown finished. Triggering rebalance.")
     try:
-        service = OnChainService()
-        service.rebalance_positions()
-        # NAV update will be triggered by the RebalanceExecuted event
+        service = get_onchain_service()
+        # Return once the node accepts the tx; NAV update will be triggered by the RebalanceExecuted event
+        service.rebalance_positions(wait=False)
     except Exception as e:
-        log.error("Error during rebalance trigger task.", error=str(e), exc_info=True)
\ No newline at end of file
+        log.error("Error during rebalance trigger task.", error=str(e), exc_info=True)
+
+def schedule_nav_update(trigger_source: str):
+    """
+    Queues a debounced NAV update. While one is already queued, further triggers
+    (from any process) are absorbed into it instead of enqueueing another task.
+    """
+    countdown = settings.NAV_UPDATE_DEBOUNCE_SECONDS
+    if cache.add(NAV_UPDATE_PENDING_KEY, trigger_source, timeout=countdown + 60):
+        update_nav_task.apply_async(kwargs={'trigger_source': trigger_source}, countdown=countdown)
+    else:
+        log.debug("NAV update already queued; coalescing trigger.", trigger=trigger_source)
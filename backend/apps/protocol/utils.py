@@ -1,11 +1,21 @@
 import json
+from decimal import Context, Decimal
+from functools import lru_cache
 from pathlib import Path
 from django.conf import settings
 
+@lru_cache(maxsize=None)
 def load_abi(name: str):
-    """Loads a contract ABI from the /abi/ directory."""
+    """Loads a contract ABI from the /abi/ directory. Parsed once per process; callers must not mutate it."""
     abi_path = Path(settings.BASE_DIR) / "abi" / f"{name}.json"
     if not abi_path.exists():
         raise FileNotFoundError(f"ABI file not found at: {abi_path}")
     with open(abi_path, 'r') as f:
-        return json.load(f)
\ No newline at end of file
+        return json.load(f)
+
+# A uint256 has at most 78 digits, so scaling one by a power of ten is exact at this precision
+UINT256_CONTEXT = Context(prec=78)
+
+def from_base_units(value: int, decimals: int) -> Decimal:
+    """Converts an on-chain integer amount to a Decimal with `decimals` places, without rounding."""
+    return Decimal(value).scaleb(-decimals, UINT256_CONTEXT)
@@ -9,7 +9,7 @@ from apps.core.permissions import IsAdminRole
 
 from .models import GMXPosition, ProtocolState
 from .serializers import GMXPositionSerializer, HeartbeatSerializer, UpdateBasketWeightSerializer, SuccessStatusSerializer, UpdateWeightsSuccessSerializer, ErrorResponseSerializer
-from .services import OnChainService 
+from .services import get_onchain_service
 from drf_spectacular.utils import extend_schema 
 
 log = structlog.get_logger(__name__)
@@ -85,7 +85,7 @@ class TriggerUpdateWeightsView(views.APIView):
         new_weight_bps = validated_data['newWeightBps']
 
         try:
-            onchain_service = OnChainService()
+            onchain_service = get_onchain_service()
 
             # 1. Get current total weights
             current_total_weights = onchain_service.get_total_basket_weights()
@@ -110,7 +110,8 @@ class TriggerUpdateWeightsView(views.APIView):
             # --- END VALIDATION ---
 
             # If validation passes, send the transaction
-            tx_hash = onchain_service.update_basket_weight(basket_index, new_weight_bps)
+            # Respond as soon as the node accepts the tx; the listener records the BasketAllocationUpdated event
+            tx_hash = onchain_service.update_basket_weight(basket_index, new_weight_bps, wait=False)
             
             return Response({
                 "status": "Weight update transaction sent successfully.",
@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from enum import Enum
@@ -331,6 +332,17 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
 
+# Tasks are few and long (RPC-bound NAV updates, multi-minute rebalance cooldowns):
+# don't let one worker hoard queued tasks.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# The NAV tasks drive their async RPC pipeline with asyncio.run, which fails on a gevent pool
+# while another task's event loop is running; they get their own queue, served by a prefork worker.
+CELERY_TASK_ROUTES = {
+    'protocol.update_nav': {'queue': 'nav'},
+    'protocol.verify_nav_submissions': {'queue': 'nav'},
+}
+
 # ==============================================================================
 # SIMPLE JWT (JSON Web Token) CONFIGURATION
 # ==============================================================================
@@ -410,10 +422,27 @@ BASKET_ORACLE_CONTRACT_ADDRESS = os.getenv("BASKET_ORACLE_CONTRACT_ADDRESS")
 GMX_READER_CONTRACT_ADDRESS = os.getenv("GMX_READER_CONTRACT_ADDRESS")
 GMX_DATA_STORE_ADDRESS = os.getenv("GMX_DATA_STORE_ADDRESS")
 USDC_ADDRESS = os.getenv("USDC_ADDRESS")
+# Multicall3 is deployed at the same address on Arbitrum and most EVM chains; set empty on
+# nodes without it (e.g. a bare local devnet) to fall back to JSON-RPC batches.
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+# Optional NavAggregator view contract (blockchain/contracts/NavAggregator.sol); when set, NAV runs
+# sum GMX collateral in one eth_call instead of reading every position struct.
+NAV_AGGREGATOR_ADDRESS = os.getenv("NAV_AGGREGATOR_ADDRESS")
+# Parallel eth_calls used for multi-call reads when neither Multicall3 nor JSON-RPC batching is available
+RPC_CONCURRENCY = int(os.getenv("RPC_CONCURRENCY", 16))
 
 # --- Task Intervals & Values ---
 REBALANCE_COOLDOWN_SECONDS = int(os.getenv("REBALANCE_COOLDOWN_SECONDS", 300))
 REBALANCE_EXECUTION_FEE_ETH = os.getenv("REBALANCE_EXECUTION_FEE_ETH", "0.1") 
+# Optional fixed gas limits per contract function, e.g. {"submitNAV": 250000}; functions not listed
+# are estimated per transaction. Arbitrum gas includes a variable L1 component, so none are pinned by default.
+TX_GAS_LIMITS = json.loads(os.getenv("TX_GAS_LIMITS", "{}"))
+# How long NAV runs reuse a cached getBasketLength(); the event listener invalidates it when BasketAllocationAdded is mined
+BASKET_LENGTH_CACHE_SECONDS = int(os.getenv("BASKET_LENGTH_CACHE_SECONDS", 300))
+# Upper bound on reusing cached position keys; the event listener invalidates them as positions open and close
+POSITION_KEYS_CACHE_SECONDS = int(os.getenv("POSITION_KEYS_CACHE_SECONDS", 300))
+# Event-driven NAV updates requested within this window coalesce into a single task run
+NAV_UPDATE_DEBOUNCE_SECONDS = int(os.getenv("NAV_UPDATE_DEBOUNCE_SECONDS", 5))
 
 # --- External Services ---
 DATA_FETCHER_AI_AGENT_API_URL = os.getenv("DATA_FETCHER_AI_AGENT_API_URL")
@@ -422,11 +451,18 @@ NAV_UPDATE_INTERVAL_SECONDS = int(os.getenv("NAV_UPDATE_INTERVAL_SECONDS", 300))
 
 HOT_WALLET_PRIVATE_KEY = os.getenv("HOT_WALLET_PRIVATE_KEY")
 
+NAV_VERIFY_INTERVAL_SECONDS = int(os.getenv("NAV_VERIFY_INTERVAL_SECONDS", 30))
+
 CELERY_BEAT_SCHEDULE = {
         'periodic-nav-update': {
         'task': 'protocol.update_nav',
         'schedule': NAV_UPDATE_INTERVAL_SECONDS,
     },
+    # NAV transactions are submitted without waiting; this resolves their inclusion status
+    'verify-nav-submissions': {
+        'task': 'protocol.verify_nav_submissions',
+        'schedule': NAV_VERIFY_INTERVAL_SECONDS,
+    },
 }
 
 # ==============================================================================
@@ -434,6 +470,14 @@ CELERY_BEAT_SCHEDULE = {
 # ==============================================================================
 EVENT_LISTENER_POLL_INTERVAL_SECONDS = int(os.getenv("EVENT_LISTENER_POLL_INTERVAL_SECONDS", 15))
 EVENT_LISTENER_ERROR_POLL_INTERVAL_SECONDS = int(os.getenv("EVENT_LISTENER_ERROR_POLL_INTERVAL_SECONDS", 60))
+EVENT_LISTENER_MAX_BLOCK_RANGE = int(os.getenv("EVENT_LISTENER_MAX_BLOCK_RANGE", 500))
+EVENT_LISTENER_FETCH_CONCURRENCY = int(os.getenv("EVENT_LISTENER_FETCH_CONCURRENCY", 16))
+EVENT_LISTENER_CONCURRENCY = int(os.getenv("EVENT_LISTENER_CONCURRENCY", 16))
+# Blocks behind the head before a block is processed and checkpointed. 0 follows the tip directly over a
+# logs subscription: reorged-out logs trigger a rewind and re-scan, but writes and transactions already made from them stay
+EVENT_LISTENER_CONFIRMATIONS = int(os.getenv("EVENT_LISTENER_CONFIRMATIONS", 6))
+# Checkpoints go to the cache on every range; the database copy is refreshed at most this often
+EVENT_LISTENER_STATE_PERSIST_INTERVAL_SECONDS = int(os.getenv("EVENT_LISTENER_STATE_PERSIST_INTERVAL_SECONDS", 60))
 
 
 # ==============================================================================
@@ -0,0 +1,83 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.8.28;
+
+// ═══════════════════════════════════════════════════════════
+// INTERFACES
+// ═══════════════════════════════════════════════════════════
+
+interface IGMXReader {
+    struct Addresses {
+        address account;
+        address market;
+        address collateralToken;
+    }
+
+    struct Numbers {
+        uint256 sizeInUsd;
+        uint256 sizeInTokens;
+        uint256 collateralAmount;
+        uint256 borrowingFactor;
+        uint256 fundingFeeAmountPerSize;
+        uint256 longTokenClaimableFundingAmountPerSize;
+        uint256 shortTokenClaimableFundingAmountPerSize;
+        uint256 increasedAtTime;
+        uint256 decreasedAtTime;
+    }
+
+    struct Flags {
+        bool isLong;
+    }
+
+    struct Props {
+        Addresses addresses;
+        Numbers numbers;
+        Flags flags;
+    }
+
+    function getPosition(
+        address dataStore,
+        bytes32 key
+    ) external view returns (Props memory);
+}
+
+// ═══════════════════════════════════════════════════════════
+// NAV AGGREGATOR CONTRACT
+// ═══════════════════════════════════════════════════════════
+
+/**
+ * @title NavAggregator
+ * @notice Stateless read helper for the NAV calculator backend
+ * @dev Sums collateral across GMX positions in a single eth_call, so the backend
+ *      receives one uint256 instead of a full Position struct per key
+ */
+contract NavAggregator {
+    /**
+     * @notice Sum collateralAmount over a set of GMX positions
+     * @dev Positions whose read reverts are skipped and counted, mirroring the
+     *      backend's per-position fallback behaviour
+     * @param reader GMX Reader contract
+     * @param dataStore GMX DataStore contract
+     * @param keys Position keys to sum
+     * @return total Sum of collateralAmount over the readable positions
+     * @return failed Number of keys whose getPosition call reverted
+     */
+    function sumCollateral(
+        address reader,
+        address dataStore,
+        bytes32[] calldata keys
+    ) external view returns (uint256 total, uint256 failed) {
+        uint256 length = keys.length;
+        for (uint256 i = 0; i < length; ) {
+            try IGMXReader(reader).getPosition(dataStore, keys[i]) returns (
+                IGMXReader.Props memory position
+            ) {
+                total += position.numbers.collateralAmount;
+            } catch {
+                failed++;
+            }
+            unchecked {
+                ++i;
+            }
+        }
+    }
+}
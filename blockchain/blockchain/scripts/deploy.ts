@@ -80,7 +80,7 @@ async function main() {
   // STEP 1: DEPLOY BASKET ORACLE
   // ═══════════════════════════════════════════════════════════════════════════
   
-  console.log(" [1/6] Deploying BasketOracle...");
+  console.log(" [1/7] Deploying BasketOracle...");
   const BasketOracle = await ethers.getContractFactory("BasketOracle");
   const basketOracle = await BasketOracle.deploy(
     PYTH_ADDRESS,
@@ -100,7 +100,7 @@ async function main() {
   // STEP 2: DEPLOY GMXV2 POSITION MANAGER (WRAPPER)
   // ═══════════════════════════════════════════════════════════════════════════
   
-  console.log(" [2/6] Deploying GMXV2PositionManager...");
+  console.log(" [2/7] Deploying GMXV2PositionManager...");
   
   // Deploy with placeholder BasketManager (will set later)
   const GMXV2PositionManager = await ethers.getContractFactory("GMXV2PerpWrapper");
@@ -122,7 +122,7 @@ async function main() {
   // STEP 3: DEPLOY BASKET MANAGER
   // ═══════════════════════════════════════════════════════════════════════════
   
-  console.log(" [3/6] Deploying BasketManager...");
+  console.log(" [3/7] Deploying BasketManager...");
   const BasketManager = await ethers.getContractFactory("BasketManager");
   const basketManager = await BasketManager.deploy(
     basketOracleAddress,
@@ -146,7 +146,7 @@ async function main() {
   // STEP 4: DEPLOY SHIELD VAULT
   // ═══════════════════════════════════════════════════════════════════════════
   
-  console.log("  [4/6] Deploying ShieldVault...");
+  console.log("  [4/7] Deploying ShieldVault...");
   const ShieldVault = await ethers.getContractFactory("ShieldVault");
   const shieldVault = await ShieldVault.deploy(
     basketOracleAddress,
@@ -173,7 +173,7 @@ async function main() {
   // STEP 5: DEPLOY TREASURY CONTROLLER
   // ═══════════════════════════════════════════════════════════════════════════
   
-  console.log(" [5/6] Deploying TreasuryController...");
+  console.log(" [5/7] Deploying TreasuryController...");
   const TreasuryController = await ethers.getContractFactory("TreasuryController");
   const treasuryController = await TreasuryController.deploy(
     basketOracleAddress,
@@ -203,7 +203,7 @@ async function main() {
   let pyusdIntegrationAddress = ethers.ZeroAddress;
   
   if (PYUSD_ADDRESS !== ethers.ZeroAddress && PYUSD_ADDRESS !== "0x0000000000000000000000000000000000000000") {
-    console.log(" [6/6] Deploying PYUSDIntegration...");
+    console.log(" [6/7] Deploying PYUSDIntegration...");
     const PYUSDIntegration = await ethers.getContractFactory("PYUSDIntegration");
     const pyusdIntegration = await PYUSDIntegration.deploy(
       PYUSD_ADDRESS,
@@ -218,9 +218,20 @@ async function main() {
     pyusdIntegrationAddress = await pyusdIntegration.getAddress();
     console.log(" PYUSDIntegration deployed at:", pyusdIntegrationAddress, "\n");
   } else {
-    console.log("  [6/6] Skipping PYUSDIntegration (PYUSD not available on this network)\n");
+    console.log("  [6/7] Skipping PYUSDIntegration (PYUSD not available on this network)\n");
   }
 
+  // ═══════════════════════════════════════════════════════════════════════════
+  // STEP 7: DEPLOY NAV AGGREGATOR (stateless read helper for the backend)
+  // ═══════════════════════════════════════════════════════════════════════════
+
+  console.log(" [7/7] Deploying NavAggregator...");
+  const NavAggregator = await ethers.getContractFactory("NavAggregator");
+  const navAggregator = await NavAggregator.deploy();
+  await navAggregator.waitForDeployment();
+  const navAggregatorAddress = await navAggregator.getAddress();
+  console.log(" NavAggregator deployed at:", navAggregatorAddress, "\n");
+
   // ═══════════════════════════════════════════════════════════════════════════
   // DEPLOYMENT SUMMARY
   // ═══════════════════════════════════════════════════════════════════════════
@@ -235,6 +246,7 @@ async function main() {
   console.log("  BasketManager:         ", basketManagerAddress);
   console.log("  ShieldVault (SHIELD):  ", shieldVaultAddress);
   console.log("  TreasuryController:    ", treasuryControllerAddress);
+  console.log("  NavAggregator:         ", navAggregatorAddress);
   if (pyusdIntegrationAddress !== ethers.ZeroAddress) {
     console.log("  PYUSDIntegration:      ", pyusdIntegrationAddress);
   }
@@ -279,6 +291,7 @@ async function main() {
       BasketManager: basketManagerAddress,
       ShieldVault: shieldVaultAddress,
       TreasuryController: treasuryControllerAddress,
+      NavAggregator: navAggregatorAddress,
       PYUSDIntegration: pyusdIntegrationAddress !== ethers.ZeroAddress ? pyusdIntegrationAddress : null
     },
     externalAddresses: {
@@ -8,6 +8,10 @@ from hyperon import MeTTa
 class MarketAnalyzer:
     def __init__(self, metta_instance: MeTTa):
         self.metta = metta_instance
+        # The knowledge graph is static once initialized, so per-regime
+        # query results are memoized instead of re-matched every tick
+        self._preferences_cache = {}
+        self._baseline_weights_cache = {}
     
     def determine_market_regime(self, cpi: float, interest_rate: float, volatility: float) -> str:
         """Determine current market regime based on indicators"""
@@ -34,6 +38,9 @@ class MarketAnalyzer:
     
     def get_regime_preferences(self, regime: str) -> dict:
         """Query MeTTa for asset preferences in given regime"""
+        if regime in self._preferences_cache:
+            return dict(self._preferences_cache[regime])
+
         preferences = {}
         
         for asset in ["gold", "silver", "oil"]:
@@ -46,15 +53,13 @@ class MarketAnalyzer:
             else:
                 preferences[asset] = "medium"  # Default
         
-        return preferences
+        self._preferences_cache[regime] = preferences
+        return dict(preferences)
     
     def calculate_target_weights(self, regime: str, current_weights: dict, 
                                  cpi: float, volatility: float) -> dict:
         """Calculate target weights based on regime and current state"""
         
-        # Get baseline weights for regime
-        target_weights = {}
-        
         # Map regime to baseline allocation type
         allocation_type = regime
         if regime == "normal":
@@ -64,18 +69,8 @@ class MarketAnalyzer:
         elif regime == "high_volatility":
             allocation_type = "defensive"
         
-        # Query baseline weights
-        for asset in ["gold", "silver", "oil", "cash"]:
-            query_str = f'!(match &self (baseline_weight {allocation_type} {asset} $weight) $weight)'
-            results = self.metta.run(query_str)
-            
-            if results and len(results) > 0 and len(results[0]) > 0:
-                weight_str = results[0][0].get_object().value
-                target_weights[asset] = float(weight_str)
-            else:
-                # Fallback to normal allocation
-                defaults = {"gold": 0.40, "silver": 0.20, "oil": 0.25, "cash": 0.15}
-                target_weights[asset] = defaults.get(asset, 0.15)
+        # Get baseline weights for regime
+        target_weights = dict(self._get_baseline_weights(allocation_type))
         
         # Apply volatility adjustment
         if volatility > 30:
@@ -91,6 +86,27 @@ class MarketAnalyzer:
         
         return target_weights
     
+    def _get_baseline_weights(self, allocation_type: str) -> dict:
+        """Query MeTTa for the baseline weights of an allocation type (memoized)"""
+        if allocation_type in self._baseline_weights_cache:
+            return self._baseline_weights_cache[allocation_type]
+
+        baseline_weights = {}
+        for asset in ["gold", "silver", "oil", "cash"]:
+            query_str = f'!(match &self (baseline_weight {allocation_type} {asset} $weight) $weight)'
+            results = self.metta.run(query_str)
+            
+            if results and len(results) > 0 and len(results[0]) > 0:
+                weight_str = results[0][0].get_object().value
+                baseline_weights[asset] = float(weight_str)
+            else:
+                # Fallback to normal allocation
+                defaults = {"gold": 0.40, "silver": 0.20, "oil": 0.25, "cash": 0.15}
+                baseline_weights[asset] = defaults.get(asset, 0.15)
+
+        self._baseline_weights_cache[allocation_type] = baseline_weights
+        return baseline_weights
+    
     def explain_reasoning(self, regime: str, adjustments: dict, 
                          cpi: float, interest_rate: float, volatility: float) -> str:
         """Generate human-readable explanation of reasoning"""